@@ -1,12 +1,37 @@
 # dashboard/app.py
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import matplotlib.pyplot as plt
 import seaborn as sns
+import os
+
+from data_loader import DATA_DIR, KOMPONEN_OPTIONS, data_version, read_pdrb_data
+from chart_specs import resolve_charts
+from validation import DataValidationError
+from release_store import STORE_DIR, load_manifest, release_for_version, revisions
+from geo_map import ZOOM_TOLERANCES, available_levels, indicator_columns, is_fixture, load_map
+from data_table import paged_table
+from monthly import (DROP_COLUMNS, INBOX, MONTHLY_DIR, REFRESH_SECONDS as MONTHLY_REFRESH_SECONDS,
+                     ingest, indicator_series, load_state, quarterly_averages)
+from figures import (
+    CHART_TYPES,
+    kpi_metrics,
+    pdrb_trend_figure,
+    component_comparison_figure,
+    household_consumption_figure,
+    government_consumption_figure,
+    consumption_growth_figure,
+    pmtb_area_figure,
+    pmtb_growth_gauge,
+    investment_vs_consumption_figure,
+    correlation_matrix,
+    linear_projection,
+    correlation_figure,
+    gentrification_map_figure,
+    monthly_indicator_figure,
+)
 
 # Page configuration
 st.set_page_config(
@@ -49,31 +74,84 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load data function
+# Load data function (cache per versi data)
 @st.cache_data
-def load_data():
-    # Load your Excel files
-    df_yoy = pd.read_excel('../data/PDRB_Jakarta_YoY.xlsx')
-    df_nilai = pd.read_excel('../data/PDRB_Jakarta_Nilai.xlsx')
+def load_data(version):
+    return read_pdrb_data(DATA_DIR)
+
+# Chart data shared with report_plots, resolved once per data version
+@st.cache_data
+def load_chart_data(version):
+    df_yoy, df_nilai, df_laju, df_pdrb_full = load_data(version)
+    return resolve_charts(df_pdrb_full, df_laju)
+
+# Precomputed simplified geometry + indicators per area (see geo_map.py)
+@st.cache_data
+def load_map_data(level, zoom):
+    return load_map(level, zoom)
+
+# Revised values in the release matching the loaded data (see release_store.py).
+# Keyed on the store's latest release id too, so a later `record` is picked up.
+@st.cache_data
+def load_revisions(version, latest_release):
+    entry = release_for_version(version, STORE_DIR)
+    if entry is None:
+        return None, None
+    return entry, revisions(entry['id'], STORE_DIR)
+
+# Full long table (nilai + pertumbuhan) for the export tab
+@st.cache_data
+def load_table_data(version):
+    df_yoy, df_nilai, df_laju, df_pdrb_full = load_data(version)
+    return df_pdrb_full.merge(df_laju, on=['Komponen', 'Triwulan'], how='outer')
+
+# Figure per monthly indicator, rebuilt only when that indicator's revision changes
+@st.cache_data
+def load_indicator_figure(indikator, revision):
+    return monthly_indicator_figure(indicator_series(indikator), indikator)
+
+# Monthly indicators: the fragment reruns on its own, ingests new drop files
+# (see monthly.py) and redraws only this section, not the whole page
+@st.fragment(run_every=MONTHLY_REFRESH_SECONDS)
+def monthly_indicators_section():
+    changed = ingest()['baru']
+    state = load_state()
     
-    # Load complete datasets
-    df_laju = pd.read_excel('../data/Laju Pertumbuhan (Y-ON-Y) PDRB Provinsi DKI Jakarta Atas Dasar Konstan 2010 Menurut Pengeluaran, 2025.xlsx')
-    df_pdrb_full = pd.read_excel('../data/PDRB Triwulanan Provinsi DKI Jakarta Atas Dasar Harga Konstan Menurut Pengeluaran, 2025.xlsx')
+    # Notify other sessions: compare with the revision this session last saw
+    seen = st.session_state.get('monthly_revision')
+    if changed:
+        st.toast("📈 Data bulanan baru: " + ", ".join(f"{k} (+{n})" for k, n in changed.items()))
+    elif seen is not None and seen != state['revision']:
+        st.toast("📈 Data bulanan diperbarui")
+    st.session_state['monthly_revision'] = state['revision']
     
-    # Clean and transform data
-    # Clean df_laju
-    df_laju = df_laju.iloc[3:].reset_index(drop=True)
-    df_laju.columns = ['Komponen', 'Triwulan I', 'Triwulan II', 'Triwulan III', 'Triwulan IV', 'Tahunan']
-    df_laju = df_laju.melt(id_vars=['Komponen'], var_name='Triwulan', value_name='Pertumbuhan')
-    df_laju = df_laju.dropna(subset=['Pertumbuhan'])
+    # Drop files that could not be read; they stay skipped until replaced
+    for name, reason in state['ditolak'].items():
+        st.error(f"File {name} di folder {INBOX}/ ditolak ({reason}). "
+                 f"Perbaiki file (kolom wajib: {', '.join(DROP_COLUMNS)}) agar di-ingest.")
     
-    # Clean df_pdrb_full
-    df_pdrb_full = df_pdrb_full.iloc[3:].reset_index(drop=True)
-    df_pdrb_full.columns = ['Komponen', 'Triwulan I', 'Triwulan II', 'Triwulan III', 'Triwulan IV', 'Tahunan']
-    df_pdrb_full = df_pdrb_full.melt(id_vars=['Komponen'], var_name='Triwulan', value_name='Nilai')
-    df_pdrb_full = df_pdrb_full.dropna(subset=['Nilai'])
+    if not state['indikator']:
+        st.info("Belum ada indikator bulanan. Letakkan file CSV (Indikator, Periode, Nilai) "
+                f"di folder {os.path.join(MONTHLY_DIR, INBOX)}/.")
+        return
     
-    return df_yoy, df_nilai, df_laju, df_pdrb_full
+    # Rows from the last ingest for months that were already stored
+    if state.get('konflik'):
+        st.warning(f"{len(state['konflik'])} baris di file masuk terakhir tidak di-ingest "
+                   "(bulan sudah tersimpan dengan nilai berbeda, atau terlambat).")
+        st.dataframe(pd.DataFrame(state['konflik']), use_container_width=True, hide_index=True)
+    
+    indikator = st.multiselect("Indikator Bulanan", list(state['indikator']),
+                               default=list(state['indikator']), key='monthly_indikator')
+    for name in indikator:
+        entry = state['indikator'][name]
+        st.plotly_chart(load_indicator_figure(name, entry['revision']),
+                        use_container_width=True, key=f'monthly_{name}')
+    
+    with st.expander("Rata-rata Triwulanan"):
+        averages = quarterly_averages(state)
+        st.dataframe(averages[averages['Indikator'].isin(indikator)],
+                     use_container_width=True, hide_index=True)
 
 # Main app
 def main():
@@ -82,7 +160,16 @@ def main():
     st.markdown('<p class="sub-header">Visualisasi Interaktif PDRB dan Indikator Ekonomi Makro 2025</p>', unsafe_allow_html=True)
     
     # Load data
-    df_yoy, df_nilai, df_laju, df_pdrb_full = load_data()
+    version = data_version(DATA_DIR)
+    try:
+        df_yoy, df_nilai, df_laju, df_pdrb_full = load_data(version)
+    except DataValidationError as e:
+        st.error(f"Rilis data {version} ditolak oleh validasi kualitas data")
+        for name, source in e.report['sources'].items():
+            for error in source['errors']:
+                st.markdown(f"- **{name}**: {error}")
+        st.stop()
+    charts = load_chart_data(version)
     
     # Sidebar
     with st.sidebar:
@@ -94,22 +181,16 @@ def main():
         tahun = st.selectbox("Pilih Tahun", [2025], index=0)
         
         st.subheader("Komponen Ekonomi")
-        komponen_options = [
-            'Pengeluaran Konsumsi Rumah Tangga',
-            'Pengeluaran Konsumsi Pemerintah',
-            'Pembentukan Modal Tetap Bruto',
-            'PDRB'
-        ]
         selected_components = st.multiselect(
             "Pilih Komponen",
-            komponen_options,
-            default=komponen_options
+            KOMPONEN_OPTIONS,
+            default=KOMPONEN_OPTIONS
         )
         
         st.subheader("Jenis Visualisasi")
         chart_type = st.selectbox(
             "Tipe Chart",
-            ["Line Chart", "Bar Chart", "Area Chart", "Scatter Plot"]
+            CHART_TYPES
         )
         
         st.subheader("Metrik Tambahan")
@@ -120,12 +201,13 @@ def main():
         st.caption("Sumber Data: BPS Provinsi DKI Jakarta 2025")
     
     # Main content
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
         "📊 Overview", 
         "💰 Konsumsi", 
         "🏗️ Investasi", 
         "📈 Analisis", 
-        "📥 Ekspor"
+        "📥 Ekspor",
+        "🗺️ Peta Gentrifikasi"
     ])
     
     with tab1:
@@ -133,77 +215,24 @@ def main():
         
         # KPI Metrics
         if show_metrics:
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                pdrb_q3 = df_pdrb_full[(df_pdrb_full['Komponen'] == 'PDRB') & 
-                                      (df_pdrb_full['Triwulan'] == 'Triwulan III')]['Nilai'].values[0]
-                st.metric(
-                    label="PDRB Q3 2025",
-                    value=f"Rp {pdrb_q3/1000:.1f}T",
-                    delta="4.96% YoY"
-                )
-            
-            with col2:
-                konsumsi_rt = df_pdrb_full[(df_pdrb_full['Komponen'] == 'Pengeluaran Konsumsi Rumah Tangga') & 
-                                         (df_pdrb_full['Triwulan'] == 'Triwulan III')]['Nilai'].values[0]
-                st.metric(
-                    label="Konsumsi Rumah Tangga",
-                    value=f"Rp {konsumsi_rt/1000:.1f}T",
-                    delta="5.01% YoY"
-                )
-            
-            with col3:
-                pmtb_q3 = df_pdrb_full[(df_pdrb_full['Komponen'] == 'Pembentukan Modal Tetap Bruto') & 
-                                      (df_pdrb_full['Triwulan'] == 'Triwulan III')]['Nilai'].values[0]
-                st.metric(
-                    label="Investasi (PMTB)",
-                    value=f"Rp {pmtb_q3/1000:.1f}T",
-                    delta="3.67% YoY"
-                )
-            
-            with col4:
-                growth_avg = df_laju[df_laju['Komponen'] == 'PDRB']['Pertumbuhan'].mean()
-                st.metric(
-                    label="Rata-rata Pertumbuhan",
-                    value=f"{growth_avg:.2f}%",
-                    delta="0.23% dari Q2"
-                )
+            for col, metric in zip(st.columns(4), kpi_metrics(df_pdrb_full, df_laju)):
+                with col:
+                    st.metric(**metric)
         
         # Chart 1: PDRB Trend
         st.subheader("Tren PDRB Triwulanan 2025")
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            pdrb_data = df_pdrb_full[df_pdrb_full['Komponen'] == 'PDRB']
-            
-            if chart_type == "Line Chart":
-                fig1 = px.line(pdrb_data, x='Triwulan', y='Nilai',
-                              markers=True, line_shape='spline',
-                              title='Perkembangan PDRB DKI Jakarta 2025')
-            elif chart_type == "Bar Chart":
-                fig1 = px.bar(pdrb_data, x='Triwulan', y='Nilai',
-                             title='Perkembangan PDRB DKI Jakarta 2025',
-                             color='Triwulan')
-            elif chart_type == "Area Chart":
-                fig1 = px.area(pdrb_data, x='Triwulan', y='Nilai',
-                              title='Perkembangan PDRB DKI Jakarta 2025')
-            else:
-                fig1 = px.scatter(pdrb_data, x='Triwulan', y='Nilai',
-                                 title='Perkembangan PDRB DKI Jakarta 2025',
-                                 size=[20, 25, 30])
+            pdrb_data = charts['pdrb_trend']
             
-            fig1.update_layout(
-                yaxis_title="Nilai (Miliar Rupiah)",
-                xaxis_title="Triwulan",
-                hovermode='x unified'
-            )
+            fig1 = pdrb_trend_figure(pdrb_data, chart_type)
             st.plotly_chart(fig1, use_container_width=True)
         
         with col2:
             st.subheader("Data Points")
-            st.dataframe(pdrb_data[['Triwulan', 'Nilai']].style.format({'Nilai': 'Rp {:,.0f}'}),
-                        use_container_width=True)
+            paged_table(pdrb_data[['Triwulan', 'Nilai']], key='data_points',
+                        cache_key=('data_points', version), formats={'Nilai': 'rupiah'})
         
         # Chart 2: Comparison Chart
         st.subheader("Perbandingan Komponen Utama")
@@ -212,16 +241,14 @@ def main():
             'Pengeluaran Konsumsi Rumah Tangga',
             'Pembentukan Modal Tetap Bruto',
             'Pengeluaran Konsumsi Pemerintah'
-        ])]
-        
-        fig2 = px.line(comparison_data, x='Triwulan', y='Nilai', color='Komponen',
-                      markers=True, title='Perbandingan Komponen Ekonomi Utama')
-        fig2.update_layout(
-            yaxis_title="Nilai (Miliar Rupiah)",
-            xaxis_title="Triwulan",
-            legend_title="Komponen"
-        )
+        ]) & df_pdrb_full['Komponen'].isin(selected_components)]
+        
+        fig2 = component_comparison_figure(comparison_data)
         st.plotly_chart(fig2, use_container_width=True)
+        
+        # Monthly indicators (append-only, refreshed live)
+        st.subheader("Indikator Bulanan")
+        monthly_indicators_section()
     
     with tab2:
         st.header("Analisis Konsumsi")
@@ -230,53 +257,14 @@ def main():
         
         with col1:
             # Konsumsi Rumah Tangga
-            konsumsi_rt_data = df_pdrb_full[df_pdrb_full['Komponen'] == 'Pengeluaran Konsumsi Rumah Tangga']
-            
-            fig3 = go.Figure()
-            fig3.add_trace(go.Bar(
-                x=konsumsi_rt_data['Triwulan'],
-                y=konsumsi_rt_data['Nilai'],
-                name='Nilai',
-                marker_color='#2E86C1'
-            ))
-            
-            # Add growth line
-            growth_rt = df_laju[df_laju['Komponen'] == 'Pengeluaran Konsumsi Rumah Tangga']
-            fig3.add_trace(go.Scatter(
-                x=growth_rt['Triwulan'],
-                y=growth_rt['Pertumbuhan'] * 5000,  # Scale for visualization
-                name='Pertumbuhan (%)',
-                yaxis='y2',
-                line=dict(color='#E74C3C', width=3),
-                mode='lines+markers'
-            ))
-            
-            fig3.update_layout(
-                title='Konsumsi Rumah Tangga & Pertumbuhan',
-                yaxis=dict(title='Nilai (Miliar Rupiah)'),
-                yaxis2=dict(
-                    title='Pertumbuhan (%)',
-                    overlaying='y',
-                    side='right',
-                    range=[0, 30]
-                ),
-                hovermode='x unified'
-            )
+            fig3 = household_consumption_figure(charts['konsumsi_rt'])
             st.plotly_chart(fig3, use_container_width=True)
         
         with col2:
             # Konsumsi Pemerintah
             konsumsi_gov_data = df_pdrb_full[df_pdrb_full['Komponen'] == 'Pengeluaran Konsumsi Pemerintah']
             
-            fig4 = px.bar(konsumsi_gov_data, x='Triwulan', y='Nilai',
-                         title='Konsumsi Pemerintah per Triwulan',
-                         color='Nilai',
-                         color_continuous_scale='Viridis')
-            
-            fig4.update_layout(
-                yaxis_title="Nilai (Miliar Rupiah)",
-                xaxis_title="Triwulan"
-            )
+            fig4 = government_consumption_figure(konsumsi_gov_data)
             st.plotly_chart(fig4, use_container_width=True)
         
         # Growth Analysis
@@ -285,14 +273,9 @@ def main():
         growth_comparison = df_laju[df_laju['Komponen'].isin([
             'Pengeluaran Konsumsi Rumah Tangga',
             'Pengeluaran Konsumsi Pemerintah'
-        ])]
+        ]) & df_laju['Komponen'].isin(selected_components)]
         
-        fig5 = px.bar(growth_comparison, x='Triwulan', y='Pertumbuhan', color='Komponen',
-                     barmode='group', title='Pertumbuhan YoY Konsumsi')
-        fig5.update_layout(
-            yaxis_title="Pertumbuhan (%)",
-            xaxis_title="Triwulan"
-        )
+        fig5 = consumption_growth_figure(growth_comparison)
         st.plotly_chart(fig5, use_container_width=True)
     
     with tab3:
@@ -302,46 +285,14 @@ def main():
         
         with col1:
             # PMTB Value
-            pmtb_data = df_pdrb_full[df_pdrb_full['Komponen'] == 'Pembentukan Modal Tetap Bruto']
-            
-            fig6 = px.area(pmtb_data, x='Triwulan', y='Nilai',
-                          title='Akumulasi Investasi (PMTB) 2025',
-                          color_discrete_sequence=['#27AE60'])
-            
-            fig6.update_layout(
-                yaxis_title="Nilai (Miliar Rupiah)",
-                xaxis_title="Triwulan"
-            )
+            fig6 = pmtb_area_figure(charts['pmtb'])
             st.plotly_chart(fig6, use_container_width=True)
         
         with col2:
             # PMTB Growth
             pmtb_growth = df_laju[df_laju['Komponen'] == 'Pembentukan Modal Tetap Bruto']
             
-            fig7 = go.Figure(data=[
-                go.Indicator(
-                    mode="gauge+number+delta",
-                    value=pmtb_growth['Pertumbuhan'].mean(),
-                    title={'text': "Rata-rata Pertumbuhan PMTB"},
-                    delta={'reference': 3.0},
-                    gauge={
-                        'axis': {'range': [None, 10]},
-                        'bar': {'color': "#2ECC71"},
-                        'steps': [
-                            {'range': [0, 3], 'color': "lightgray"},
-                            {'range': [3, 6], 'color': "gray"},
-                            {'range': [6, 10], 'color': "darkgray"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 6
-                        }
-                    }
-                )
-            ])
-            
-            fig7.update_layout(height=300)
+            fig7 = pmtb_growth_gauge(pmtb_growth)
             st.plotly_chart(fig7, use_container_width=True)
         
         # Investment Analysis
@@ -350,18 +301,49 @@ def main():
         comparison_df = df_pdrb_full[df_pdrb_full['Komponen'].isin([
             'Pembentukan Modal Tetap Bruto',
             'Pengeluaran Konsumsi Rumah Tangga'
-        ])]
+        ]) & df_pdrb_full['Komponen'].isin(selected_components)]
         
-        fig8 = px.scatter(comparison_df, x='Triwulan', y='Nilai', color='Komponen',
-                         size='Nilai', hover_name='Komponen',
-                         title='Perbandingan Skala: Investasi vs Konsumsi RT')
-        
-        fig8.update_layout(
-            yaxis_title="Nilai (Miliar Rupiah)",
-            xaxis_title="Triwulan"
-        )
+        fig8 = investment_vs_consumption_figure(comparison_df)
         st.plotly_chart(fig8, use_container_width=True)
     
+    with tab6:
+        st.header("Peta Gentrifikasi Kecamatan/Kelurahan")
+        
+        levels = available_levels()
+        if not levels:
+            st.info("File GeoJSON dan indikator belum tersedia di folder geo/ "
+                    "(lihat geo_map.py untuk format file).")
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                level = st.selectbox("Tingkat Wilayah", levels)
+            with col2:
+                zoom = st.select_slider("Tingkat Detail (zoom)", list(ZOOM_TOLERANCES),
+                                        value=sorted(ZOOM_TOLERANCES)[len(ZOOM_TOLERANCES) // 2])
+            geojson, indicators = load_map_data(level, zoom)
+            with col3:
+                indikator = st.selectbox("Indikator", indicator_columns(indicators))
+            
+            if is_fixture(indicators):
+                st.warning("Peta ini memakai data contoh sintetis (grid wilayah dan nilai indikator "
+                           "buatan), bukan batas wilayah atau data asli DKI Jakarta. Ganti file di "
+                           "folder geo/ dengan data BPS (lihat geo_map.py).")
+            
+            if indikator is None:
+                st.warning(f"Tidak ada kolom indikator numerik untuk tingkat {level}.")
+            else:
+                fig_map = gentrification_map_figure(geojson, indicators, indikator, level)
+                st.plotly_chart(fig_map, use_container_width=True)
+    
+    with tab5:
+        st.header("Ekspor Data PDRB")
+        
+        table_data = load_table_data(version)
+        paged_table(table_data, key='ekspor', cache_key=('ekspor', version),
+                    formats={'Nilai': 'rupiah', 'Pertumbuhan': '{:.2f}%'})
+        st.download_button("⬇️ Download CSV", table_data.to_csv(index=False).encode('utf-8'),
+                           file_name=f'pdrb_dki_{version}.csv', mime='text/csv')
+    
     with tab4:
         st.header("Analisis Lanjutan")
         
@@ -377,41 +359,58 @@ def main():
         ]
         
         corr_data = df_pdrb_full[df_pdrb_full['Komponen'].isin(components_for_corr)]
-        corr_pivot = corr_data.pivot(index='Komponen', columns='Triwulan', values='Nilai')
-        corr_matrix = corr_pivot.T.corr()
-        
-        # Shorten labels
-        corr_matrix.index = [k.replace('Pengeluaran Konsumsi ', '').replace('Pembentukan ', '') 
-                            for k in corr_matrix.index]
-        corr_matrix.columns = corr_matrix.index
+        corr_matrix = correlation_matrix(corr_data)
         
-        fig9 = px.imshow(corr_matrix,
-                        text_auto='.2f',
-                        aspect="auto",
-                        color_continuous_scale='RdBu',
-                        title='Matriks Korelasi Antar Komponen Ekonomi')
+        fig9 = correlation_figure(corr_matrix)
         
         st.plotly_chart(fig9, use_container_width=True)
         
+        # Revisions since the previous BPS release
+        st.subheader("Revisi Sejak Rilis Sebelumnya")
+        manifest = load_manifest(STORE_DIR)
+        entry, revised = load_revisions(version, manifest[-1]['id'] if manifest else None)
+        if entry is None:
+            st.warning(f"Rilis data {version} belum tercatat di release store. "
+                       "Jalankan `python release_store.py record` untuk mencatatnya.")
+        elif revised is None:
+            st.info(f"Rilis #{entry['id']} adalah rilis pertama di release store, "
+                    "belum ada rilis sebelumnya untuk dibandingkan.")
+        elif revised.empty:
+            st.success(f"Tidak ada nilai yang direvisi pada rilis #{entry['id']}.")
+        else:
+            paged_table(revised, key='revisi', cache_key=('revisi', version), formats={
+                'Nilai Lama': '{:,.2f}', 'Nilai Baru': '{:,.2f}',
+                'Selisih': '{:+,.2f}', 'Selisih (%)': '{:+.2f}%'
+            })
+        
         # Forecast (simple)
-        if show_forecast:
-            st.subheader("Proyeksi Q4 2025")
-            
-            # Simple linear projection
-            pdrb_values = df_pdrb_full[df_pdrb_full['Komponen'] == 'PDRB']['Nilai'].values
-            quarters = np.array([1, 2, 3])
+        # Quarters only, sorted (chart spec), so the annual total is never fitted
+        pdrb_values = list(charts['pdrb_trend']['Nilai'])
+        n = len(pdrb_values)
+        if show_forecast and n < 2:
+            st.info("Proyeksi butuh minimal 2 triwulan data PDRB.")
+        elif show_forecast:
+            next_quarter = f"Q{n % 4 + 1}"
+            st.subheader(f"Proyeksi {next_quarter} {2025 + n // 4}")
             
             # Linear regression for projection
-            coeff = np.polyfit(quarters, pdrb_values, 1)
-            projected_q4 = coeff[0] * 4 + coeff[1]
+            projected = linear_projection(pdrb_values)
             
             fig10 = go.Figure()
             fig10.add_trace(go.Scatter(
-                x=['Q1', 'Q2', 'Q3', 'Q4*'],
-                y=list(pdrb_values) + [projected_q4],
+                x=[f"Q{i}" for i in range(1, n + 1)] + [f"{next_quarter}*"],
+                y=pdrb_values + [projected],
                 mode='lines+markers',
                 name='PDRB Aktual & Proyeksi',
                 line=dict(color='blue', width=3)
             ))
             
-            fig
\ No newline at end of file
+            fig10.update_layout(
+                title='Proyeksi PDRB (Tren Linear)',
+                yaxis_title="Nilai (Miliar Rupiah)",
+                xaxis_title="Triwulan"
+            )
+            st.plotly_chart(fig10, use_container_width=True)
+
+if __name__ == "__main__":
+    main()
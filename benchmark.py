@@ -0,0 +1,280 @@
+# dashboard/benchmark.py
+"""Uji diferensial: implementasi lama (mask + iterrows) vs jalur yang sudah dioptimasi.
+
+Setiap kasus dijalankan pada dataset acak berbentuk rilis BPS (urutan baris
+diacak, jumlah triwulan 3-4, sebagian pertumbuhan hilang). Hasil kedua versi
+harus sama dalam toleransi, lalu waktu keduanya diukur untuk mencatat speedup.
+
+correlation_matrix tidak punya versi lama yang berbeda, jadi dibandingkan
+dengan referensi independen (Pearson per pasangan dari mask). monthly_ingest
+hanya diuji kesetaraannya: jalur ingest membaca/menulis file sedangkan
+referensi dihitung di memori, jadi waktunya tidak dicatat sebagai speedup.
+
+    python benchmark.py --datasets 20 --seed 0
+    python benchmark.py --output benchmark.json
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from chart_specs import KOMPONEN_LABELS, resolve_charts
+from figures import correlation_matrix, kpi_metrics, linear_projection
+from formatting import format_rupiah, format_rupiah_series
+from validation import IDENTITY_SIGNS, QUARTER_CODES, QUARTERS
+
+RTOL = 1e-9
+RUPIAH_ROWS = 5000
+
+CORR_KOMPONEN = [
+    'Pengeluaran Konsumsi Rumah Tangga',
+    'Pengeluaran Konsumsi Pemerintah',
+    'Pembentukan Modal Tetap Bruto',
+    'PDRB'
+]
+
+
+def random_release(rng):
+    """Satu rilis acak: df_yoy, df_nilai (ringkas) dan df_laju, df_pdrb_full (long)"""
+    n = int(rng.integers(3, 5))
+    komponen = list(IDENTITY_SIGNS) + ['PDRB']
+    nilai = pd.DataFrame([(k, q, float(rng.uniform(1e3, 6e5)))
+                          for k in komponen for q in QUARTERS[:n]],
+                         columns=['Komponen', 'Triwulan', 'Nilai'])
+    laju = nilai.rename(columns={'Nilai': 'Pertumbuhan'})
+    laju['Pertumbuhan'] = rng.normal(4, 3, len(laju)).round(2)
+
+    def short(df):
+        df = df[df['Komponen'].isin(KOMPONEN_LABELS)].copy()
+        df['Komponen'] = df['Komponen'].map(KOMPONEN_LABELS)
+        df['Triwulan'] = df['Triwulan'].map(dict(zip(QUARTERS, QUARTER_CODES)))
+        return df
+
+    df_yoy = short(laju)
+    # Sebagian pertumbuhan belum dirilis
+    df_yoy = df_yoy[rng.random(len(df_yoy)) > 0.2]
+
+    def shuffle(df):
+        return df.sample(frac=1, random_state=int(rng.integers(1 << 31))).reset_index(drop=True)
+
+    df_pdrb_full = shuffle(nilai)
+    return {'df_yoy': shuffle(df_yoy), 'df_nilai': shuffle(short(nilai)),
+            'df_laju': shuffle(laju), 'df_pdrb_full': df_pdrb_full,
+            # Kode proyeksi lama hanya jalan untuk tepat 3 triwulan, urut Q1..Q3 di file
+            'pdrb_3q': nilai[nilai['Triwulan'].isin(QUARTERS[:3])],
+            # Di app chart spec sudah di-cache (load_chart_data), jadi tidak ikut diukur
+            'pdrb_trend_3q': resolve_charts(nilai[nilai['Triwulan'].isin(QUARTERS[:3])],
+                                            laju)['pdrb_trend'],
+            # Kolom rupiah seukuran tabel penuh (semua skala T/M/ribuan)
+            'rupiah': pd.Series(10 ** rng.uniform(3, 14, RUPIAH_ROWS))}
+
+
+def random_monthly(rng):
+    """Seri bulanan acak beberapa indikator, dipecah jadi beberapa file masuk"""
+    periods = pd.period_range('2020-01', periods=int(rng.integers(24, 60)), freq='M')
+    frames = [pd.DataFrame({'Indikator': name, 'Periode': periods.astype(str),
+                            'Nilai': 100 * np.cumprod(1 + rng.normal(0.003, 0.01, len(periods)))})
+              for name in ['IHK', 'Harga Properti', 'Penjualan Eceran']]
+    series = pd.concat(frames, ignore_index=True)
+    cuts = np.sort(rng.choice(np.arange(1, len(periods)), size=3, replace=False))
+    return series, [series[series['Periode'].isin(chunk.astype(str))]
+                    for chunk in np.split(periods, cuts)]
+
+
+# ===============================
+# IMPLEMENTASI REFERENSI (kode lama)
+# ===============================
+
+def kpi_reference(data):
+    df_pdrb_full, df_laju = data['df_pdrb_full'], data['df_laju']
+    values = []
+    for komponen in ['PDRB', 'Pengeluaran Konsumsi Rumah Tangga', 'Pembentukan Modal Tetap Bruto']:
+        nilai = df_pdrb_full[(df_pdrb_full['Komponen'] == komponen) &
+                             (df_pdrb_full['Triwulan'] == 'Triwulan III')]['Nilai'].values[0]
+        values.append(f"Rp {nilai/1000:.1f}T")
+    growth_avg = df_laju[df_laju['Komponen'] == 'PDRB']['Pertumbuhan'].mean()
+    values.append(f"{growth_avg:.2f}%")
+    return values
+
+
+def correlation_reference(data):
+    # Referensi independen: Pearson per pasangan komponen, nilai diambil via mask
+    df_pdrb_full = data['df_pdrb_full']
+    series = {}
+    for komponen in sorted(CORR_KOMPONEN):
+        rows = df_pdrb_full[df_pdrb_full['Komponen'] == komponen]
+        series[komponen] = dict(zip(rows['Triwulan'], rows['Nilai']))
+    labels = [k.replace('Pengeluaran Konsumsi ', '').replace('Pembentukan ', '') for k in series]
+    matrix = np.zeros((len(series), len(series)))
+    for i, a in enumerate(series.values()):
+        for j, b in enumerate(series.values()):
+            common = sorted(set(a) & set(b))
+            x = np.array([a[t] for t in common]) - np.mean([a[t] for t in common])
+            y = np.array([b[t] for t in common]) - np.mean([b[t] for t in common])
+            matrix[i, j] = (x * y).sum() / np.sqrt((x ** 2).sum() * (y ** 2).sum())
+    return pd.DataFrame(matrix, index=labels, columns=labels)
+
+
+def projection_reference(data):
+    # Kode lama app.py apa adanya (urutan baris file, quarters = [1, 2, 3])
+    df_pdrb_full = data['pdrb_3q']
+    pdrb_values = df_pdrb_full[df_pdrb_full['Komponen'] == 'PDRB']['Nilai'].values
+    quarters = np.array([1, 2, 3])
+    coeff = np.polyfit(quarters, pdrb_values, 1)
+    projected_q4 = coeff[0] * 4 + coeff[1]
+    return projected_q4
+
+
+def chart_reference(data):
+    df_nilai, df_yoy = data['df_nilai'], data['df_yoy']
+    triwulan_order = {'Q1': 1, 'Q2': 2, 'Q3': 3, 'Q4': 4}
+    rows = []
+    for komponen in ['PDRB', 'Konsumsi RT', 'PMTB']:
+        chart_data = df_nilai[df_nilai['Komponen'] == komponen].copy()
+        chart_data['Order'] = chart_data['Triwulan'].map(triwulan_order)
+        chart_data = chart_data.sort_values('Order')
+        for _, row in chart_data.iterrows():
+            growth = df_yoy[(df_yoy['Komponen'] == komponen) &
+                            (df_yoy['Triwulan'] == row['Triwulan'])]
+            rows.append([row['Nilai'], growth.iloc[0]['Pertumbuhan'] if not growth.empty else np.nan])
+    return np.array(rows, dtype=float)
+
+
+def rupiah_reference(data):
+    return [format_rupiah(x) for x in data['rupiah']]
+
+
+def monthly_reference(data):
+    series = data['monthly'].sort_values(['Indikator', 'Periode'])
+    values = series.groupby('Indikator')['Nilai']
+    return np.column_stack([series['Nilai'],
+                            values.pct_change(fill_method=None) * 100,
+                            values.pct_change(12, fill_method=None) * 100])
+
+
+# ===============================
+# JALUR OPTIMASI (kode sekarang)
+# ===============================
+
+def kpi_optimized(data):
+    return [metric['value'] for metric in kpi_metrics(data['df_pdrb_full'], data['df_laju'])]
+
+
+def correlation_optimized(data):
+    df_pdrb_full = data['df_pdrb_full']
+    return correlation_matrix(df_pdrb_full[df_pdrb_full['Komponen'].isin(CORR_KOMPONEN)])
+
+
+def projection_optimized(data):
+    # Seperti app.py: nilai dari chart spec pdrb_trend (hanya triwulan, terurut)
+    return linear_projection(data['pdrb_trend_3q']['Nilai'])
+
+
+def chart_optimized(data):
+    charts = resolve_charts(data['df_nilai'], data['df_yoy'])
+    return np.concatenate([charts[name][['Nilai', 'Pertumbuhan']].to_numpy(dtype=float)
+                           for name in ['pdrb_trend', 'konsumsi_rt', 'pmtb']])
+
+
+def rupiah_optimized(data):
+    return list(format_rupiah_series(data['rupiah']))
+
+
+def monthly_optimized(data):
+    import monthly
+    monthly_dir = tempfile.mkdtemp()
+    try:
+        inbox = os.path.join(monthly_dir, monthly.INBOX)
+        os.makedirs(inbox)
+        for i, chunk in enumerate(data['monthly_files']):
+            chunk.to_csv(os.path.join(inbox, f'{i:02d}.csv'), index=False)
+            monthly.ingest(monthly_dir)
+        series = monthly.load_series(monthly_dir).sort_values(['Indikator', 'Periode'])
+        return series[['Nilai', 'MoM', 'YoY']].to_numpy(dtype=float)
+    finally:
+        monthly._SERIES.pop(monthly_dir, None)
+        shutil.rmtree(monthly_dir)
+
+
+def _numeric_equal(a, b, rtol):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    return a.shape == b.shape and np.allclose(a, b, rtol=rtol, atol=0, equal_nan=True)
+
+
+def _frame_equal(a, b, rtol):
+    return (list(a.index) == list(b.index) and list(a.columns) == list(b.columns)
+            and _numeric_equal(a.to_numpy(), b.to_numpy(), rtol))
+
+
+# nama: (referensi, optimasi, pembanding, waktu diukur)
+CASES = {
+    'kpi_metrics': (kpi_reference, kpi_optimized, lambda a, b, rtol: a == b, True),
+    'correlation_matrix': (correlation_reference, correlation_optimized, _frame_equal, True),
+    'linear_projection': (projection_reference, projection_optimized, _numeric_equal, True),
+    'resolve_charts': (chart_reference, chart_optimized, _numeric_equal, True),
+    'format_rupiah_series': (rupiah_reference, rupiah_optimized, lambda a, b, rtol: a == b, True),
+    'monthly_ingest': (monthly_reference, monthly_optimized, _numeric_equal, False),
+}
+
+
+def _best_time(fn, data, repeat):
+    return min(timeit.repeat(lambda: fn(data), number=1, repeat=repeat))
+
+
+def run_benchmark(n_datasets=20, seed=0, rtol=RTOL, repeat=5, cases=None):
+    """Jalankan semua kasus; kembalikan {kasus: {'ok', 'mismatches', 'speedup', ...}}"""
+    rng = np.random.default_rng(seed)
+    datasets = []
+    for _ in range(n_datasets):
+        data = random_release(rng)
+        data['monthly'], data['monthly_files'] = random_monthly(rng)
+        datasets.append(data)
+
+    results = {}
+    for name in cases or CASES:
+        reference, optimized, equal, timed = CASES[name]
+        mismatches = [i for i, data in enumerate(datasets)
+                      if not equal(reference(data), optimized(data), rtol)]
+        results[name] = {'ok': not mismatches, 'mismatches': mismatches,
+                         'reference_ms': None, 'optimized_ms': None, 'speedup': None}
+        if timed:
+            t_ref = sum(_best_time(reference, data, repeat) for data in datasets)
+            t_opt = sum(_best_time(optimized, data, repeat) for data in datasets)
+            results[name].update(reference_ms=t_ref / n_datasets * 1000,
+                                 optimized_ms=t_opt / n_datasets * 1000,
+                                 speedup=t_ref / t_opt)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Uji kesetaraan & kecepatan jalur optimasi")
+    parser.add_argument('--datasets', type=int, default=20, help="Jumlah dataset acak")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--rtol', type=float, default=RTOL, help="Toleransi relatif")
+    parser.add_argument('--repeat', type=int, default=5, help="Pengulangan timing per dataset")
+    parser.add_argument('--case', action='append', choices=list(CASES), help="Hanya kasus tertentu")
+    parser.add_argument('--output', default=None, help="Simpan hasil sebagai JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.datasets, args.seed, args.rtol, args.repeat, args.case)
+    print(f"{'Kasus':<22} {'Status':<8} {'Referensi':>12} {'Optimasi':>12} {'Speedup':>8}")
+    for name, r in results.items():
+        status = '✅' if r['ok'] else f"❌ {len(r['mismatches'])}"
+        if r['speedup'] is None:
+            print(f"{name:<22} {status:<8} {'(hanya uji kesetaraan)':>34}")
+        else:
+            print(f"{name:<22} {status:<8} {r['reference_ms']:>10.3f}ms {r['optimized_ms']:>10.3f}ms "
+                  f"{r['speedup']:>7.2f}x")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"📄 Hasil tersimpan: {args.output}")
+
+    if not all(r['ok'] for r in results.values()):
+        raise SystemExit(1)
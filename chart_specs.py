@@ -0,0 +1,53 @@
+# dashboard/chart_specs.py
+"""Spesifikasi chart bersama untuk dashboard Plotly (figures.py) dan laporan matplotlib (report_plots.py).
+
+Data tiap chart di-resolve sekali (filter, urutkan, gabung nilai + pertumbuhan);
+renderer hanya menggambar frame hasil resolve_charts().
+"""
+import pandas as pd
+
+# Nama lengkap BPS -> label singkat di file ringkas (dibalik untuk normalisasi)
+KOMPONEN_LABELS = {
+    'Pengeluaran Konsumsi Rumah Tangga': 'Konsumsi RT',
+    'Pengeluaran Konsumsi Pemerintah': 'Konsumsi Pemerintah',
+    'Pembentukan Modal Tetap Bruto': 'PMTB',
+    'PDRB': 'PDRB',
+}
+KOMPONEN_NAMES = {label: name for name, label in KOMPONEN_LABELS.items()}
+
+TRIWULAN_LABELS = {'Q1': 'Triwulan I', 'Q2': 'Triwulan II', 'Q3': 'Triwulan III', 'Q4': 'Triwulan IV'}
+TRIWULAN_ORDER = {'Triwulan I': 1, 'Triwulan II': 2, 'Triwulan III': 3, 'Triwulan IV': 4, 'Tahunan': 5}
+
+# Chart yang muncul di dashboard dan laporan
+CHART_SPECS = {
+    'pdrb_trend': {'komponen': 'PDRB'},                                  # fig1 / Grafik 1
+    'konsumsi_rt': {'komponen': 'Pengeluaran Konsumsi Rumah Tangga'},     # fig3 / Grafik 2
+    'pmtb': {'komponen': 'Pembentukan Modal Tetap Bruto'},               # fig6 / Grafik 3
+}
+
+
+def normalize(values, growth):
+    """Satukan frame nilai & pertumbuhan (sumber mana pun) ke skema kanonik"""
+    def canonical(df, value_col):
+        df = df[['Komponen', 'Triwulan', value_col]].copy()
+        df['Komponen'] = df['Komponen'].astype(str).str.strip().replace(KOMPONEN_NAMES)
+        df['Triwulan'] = df['Triwulan'].astype(str).str.strip().replace(TRIWULAN_LABELS)
+        df[value_col] = pd.to_numeric(df[value_col], errors='coerce')
+        return df
+
+    data = canonical(values, 'Nilai').merge(
+        canonical(growth, 'Pertumbuhan'), on=['Komponen', 'Triwulan'], how='left')
+    data['Order'] = data['Triwulan'].map(TRIWULAN_ORDER)
+    return data
+
+
+def resolve_chart(spec, data):
+    """Data satu chart: komponen terpilih, hanya triwulan, urut Q1..Q4"""
+    frame = data[(data['Komponen'] == spec['komponen']) & (data['Order'] <= 4)]
+    return frame.sort_values('Order').reset_index(drop=True)
+
+
+def resolve_charts(values, growth):
+    """Resolve semua CHART_SPECS sekali; hasilnya dipakai bersama oleh semua renderer"""
+    data = normalize(values, growth)
+    return {name: resolve_chart(spec, data) for name, spec in CHART_SPECS.items()}
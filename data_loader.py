@@ -0,0 +1,86 @@
+# dashboard/data_loader.py
+import os
+import hashlib
+import pandas as pd
+
+from validation import require_valid, validate_long, validate_wide, validation_report, wide_table
+
+# Lokasi data relatif terhadap folder dashboard
+DATA_DIR = '../data'
+
+DATA_FILES = {
+    'yoy': 'PDRB_Jakarta_YoY.xlsx',
+    'nilai': 'PDRB_Jakarta_Nilai.xlsx',
+    'laju': 'Laju Pertumbuhan (Y-ON-Y) PDRB Provinsi DKI Jakarta Atas Dasar Konstan 2010 Menurut Pengeluaran, 2025.xlsx',
+    'pdrb_full': 'PDRB Triwulanan Provinsi DKI Jakarta Atas Dasar Harga Konstan Menurut Pengeluaran, 2025.xlsx',
+}
+
+TRIWULAN_COLUMNS = ['Triwulan I', 'Triwulan II', 'Triwulan III', 'Triwulan IV', 'Tahunan']
+
+KOMPONEN_OPTIONS = [
+    'Pengeluaran Konsumsi Rumah Tangga',
+    'Pengeluaran Konsumsi Pemerintah',
+    'Pembentukan Modal Tetap Bruto',
+    'PDRB'
+]
+
+# Label komponen di file ringkas (PDRB_Jakarta_*.xlsx)
+KOMPONEN_RINGKAS = ['Konsumsi RT', 'PMTB', 'PDRB']
+
+
+def file_version(paths):
+    """Hash nama + isi sekumpulan file (urutan sesuai paths)"""
+    digest = hashlib.sha1()
+    for path in paths:
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def data_version(data_dir=DATA_DIR):
+    """Hash isi file data, berubah hanya jika ada rilis/data baru"""
+    return file_version([os.path.join(data_dir, DATA_FILES[key]) for key in sorted(DATA_FILES)])
+
+
+def read_raw_data(data_dir=DATA_DIR):
+    """Baca semua file Excel apa adanya (sebelum validasi & pembersihan)"""
+    return {key: pd.read_excel(os.path.join(data_dir, filename))
+            for key, filename in DATA_FILES.items()}
+
+
+def validate_raw_data(raw, version=None):
+    """Jalankan semua pemeriksaan kualitas data; report di-cache per versi"""
+    return validation_report({
+        'yoy': lambda: validate_long(raw['yoy'], 'Pertumbuhan', required=KOMPONEN_RINGKAS),
+        'nilai': lambda: validate_long(raw['nilai'], 'Nilai', required=KOMPONEN_RINGKAS),
+        'laju': lambda: validate_wide(raw['laju'], TRIWULAN_COLUMNS, required=KOMPONEN_OPTIONS),
+        'pdrb_full': lambda: validate_wide(raw['pdrb_full'], TRIWULAN_COLUMNS,
+                                           required=KOMPONEN_OPTIONS, identity=True),
+    }, version)
+
+
+def melt_wide(raw, value_name):
+    """Sheet BPS lebar -> long (Komponen, Triwulan, nilai numerik)"""
+    df = wide_table(raw, TRIWULAN_COLUMNS)
+    df = df.melt(id_vars=['Komponen'], var_name='Triwulan', value_name=value_name)
+    df[value_name] = pd.to_numeric(df[value_name], errors='coerce')
+    return df.dropna(subset=[value_name]).reset_index(drop=True)
+
+
+def read_pdrb_data(data_dir=DATA_DIR, validate=True):
+    """Baca, validasi dan bersihkan semua file PDRB (tanpa cache Streamlit)"""
+    raw = read_raw_data(data_dir)
+
+    # Rilis yang gagal validasi ditolak sebelum sampai ke chart
+    if validate:
+        require_valid(validate_raw_data(raw, data_version(data_dir)))
+
+    df_yoy = raw['yoy']
+    df_nilai = raw['nilai']
+
+    # Clean and transform data
+    df_laju = melt_wide(raw['laju'], 'Pertumbuhan')
+    df_pdrb_full = melt_wide(raw['pdrb_full'], 'Nilai')
+
+    return df_yoy, df_nilai, df_laju, df_pdrb_full
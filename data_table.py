@@ -0,0 +1,81 @@
+# dashboard/data_table.py
+"""Tabel data dengan sort & paging di server: hanya baris di halaman aktif
+yang diformat dan dikirim ke browser (pengganti st.dataframe(df.style.format))."""
+import numpy as np
+import streamlit as st
+
+from formatting import format_number_series, format_rupiah_series
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+# Format kolom: 'rupiah' (aturan format_rupiah) atau pola str.format/printf, mis. '{:+,.2f}'
+COLUMN_FORMATS = {'rupiah': format_rupiah_series}
+
+# Urutan baris hasil sort, per (tabel, versi data, kolom, arah)
+_ORDERS = {}
+
+
+def sort_order(df, cache_key, column=None, ascending=True):
+    """Indeks posisi baris terurut; dihitung sekali per versi data"""
+    key = (cache_key, column, ascending)
+    if key not in _ORDERS:
+        if column is None:
+            order = np.arange(len(df))
+        else:
+            # NaN selalu di akhir, apa pun arah sort
+            values = df[column].reset_index(drop=True)
+            order = values.sort_values(ascending=ascending, kind='stable',
+                                       na_position='last').index.to_numpy()
+        _ORDERS[key] = order
+    return _ORDERS[key]
+
+
+def page_window(df, order, page, page_size):
+    """Potongan baris untuk satu halaman (1-based)"""
+    start = (page - 1) * page_size
+    return df.iloc[order[start:start + page_size]]
+
+
+def format_window(window, formats):
+    """Format kolom hanya untuk baris yang tampil, per kolom (vektor)"""
+    window = window.copy()
+    for column, fmt in formats.items():
+        if column in window.columns:
+            formatter = COLUMN_FORMATS.get(fmt)
+            window[column] = (formatter(window[column]) if formatter
+                              else format_number_series(window[column], fmt)).to_numpy()
+    return window
+
+
+def paged_table(df, key, cache_key, formats=None, page_size=25):
+    """Komponen Streamlit: tabel bersort & berhalaman dari data yang sudah di-cache"""
+    formats = formats or {}
+    n = len(df)
+    if n == 0:
+        st.caption("Tidak ada data.")
+        return
+    if n <= PAGE_SIZES[0]:
+        # Tabel kecil: cukup satu halaman, tanpa kontrol sort/paging
+        st.dataframe(format_window(df, formats), use_container_width=True, hide_index=True)
+        return
+
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    with col1:
+        sort_by = st.selectbox("Urutkan", ['(asli)'] + list(df.columns), key=f'{key}_sort')
+    with col2:
+        ascending = st.radio("Arah", ['Naik', 'Turun'], horizontal=True, key=f'{key}_dir') == 'Naik'
+    with col3:
+        page_size = st.selectbox("Baris", PAGE_SIZES, index=PAGE_SIZES.index(page_size),
+                                 key=f'{key}_size')
+    pages = max(1, -(-n // page_size))
+    with col4:
+        page = st.number_input("Halaman", min_value=1, max_value=pages, value=1, step=1,
+                               key=f'{key}_page')
+
+    column = None if sort_by == '(asli)' else sort_by
+    order = sort_order(df, cache_key, column, ascending)
+    window = format_window(page_window(df, order, int(page), page_size), formats)
+
+    st.dataframe(window, use_container_width=True, hide_index=True)
+    start = (int(page) - 1) * page_size
+    st.caption(f"Baris {start + 1}–{min(start + page_size, n)} dari {n} (halaman {int(page)}/{pages})")
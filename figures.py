@@ -0,0 +1,244 @@
+# dashboard/figures.py
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from geo_map import ID_PROPERTY, NAME_PROPERTY
+
+CHART_TYPES = ["Line Chart", "Bar Chart", "Area Chart", "Scatter Plot"]
+
+
+def format_triliun(nilai):
+    """Nilai miliar rupiah -> 'Rp x.xT', '-' jika tidak tersedia"""
+    return '-' if pd.isna(nilai) else f"Rp {nilai/1000:.1f}T"
+
+
+def kpi_metrics(df_pdrb_full, df_laju):
+    """Isi 4 kartu KPI di tab Overview (label, value, delta)"""
+    q3 = (df_pdrb_full[df_pdrb_full['Triwulan'] == 'Triwulan III']
+          .groupby('Komponen')['Nilai'].first())
+    growth_avg = df_laju[df_laju['Komponen'] == 'PDRB']['Pertumbuhan'].mean()
+
+    return [
+        dict(label="PDRB Q3 2025", value=format_triliun(q3.get('PDRB')), delta="4.96% YoY"),
+        dict(label="Konsumsi Rumah Tangga",
+             value=format_triliun(q3.get('Pengeluaran Konsumsi Rumah Tangga')), delta="5.01% YoY"),
+        dict(label="Investasi (PMTB)",
+             value=format_triliun(q3.get('Pembentukan Modal Tetap Bruto')), delta="3.67% YoY"),
+        dict(label="Rata-rata Pertumbuhan",
+             value='-' if pd.isna(growth_avg) else f"{growth_avg:.2f}%", delta="0.23% dari Q2"),
+    ]
+
+
+def pdrb_trend_figure(pdrb_data, chart_type):
+    """Chart 1: tren PDRB triwulanan (chart spec 'pdrb_trend') sesuai tipe chart di sidebar"""
+    if chart_type == "Line Chart":
+        fig1 = px.line(pdrb_data, x='Triwulan', y='Nilai',
+                      markers=True, line_shape='spline',
+                      title='Perkembangan PDRB DKI Jakarta 2025')
+    elif chart_type == "Bar Chart":
+        fig1 = px.bar(pdrb_data, x='Triwulan', y='Nilai',
+                     title='Perkembangan PDRB DKI Jakarta 2025',
+                     color='Triwulan')
+    elif chart_type == "Area Chart":
+        fig1 = px.area(pdrb_data, x='Triwulan', y='Nilai',
+                      title='Perkembangan PDRB DKI Jakarta 2025')
+    else:
+        fig1 = px.scatter(pdrb_data, x='Triwulan', y='Nilai',
+                         title='Perkembangan PDRB DKI Jakarta 2025',
+                         size=list(range(20, 20 + 5 * len(pdrb_data), 5)))
+
+    fig1.update_layout(
+        yaxis_title="Nilai (Miliar Rupiah)",
+        xaxis_title="Triwulan",
+        hovermode='x unified'
+    )
+    return fig1
+
+
+def component_comparison_figure(comparison_data):
+    """Chart 2: perbandingan komponen utama"""
+    fig2 = px.line(comparison_data, x='Triwulan', y='Nilai', color='Komponen',
+                  markers=True, title='Perbandingan Komponen Ekonomi Utama')
+    fig2.update_layout(
+        yaxis_title="Nilai (Miliar Rupiah)",
+        xaxis_title="Triwulan",
+        legend_title="Komponen"
+    )
+    return fig2
+
+
+def household_consumption_figure(konsumsi_rt):
+    """Chart 3: konsumsi rumah tangga dan pertumbuhannya (chart spec 'konsumsi_rt')"""
+    fig3 = go.Figure()
+    fig3.add_trace(go.Bar(
+        x=konsumsi_rt['Triwulan'],
+        y=konsumsi_rt['Nilai'],
+        name='Nilai',
+        marker_color='#2E86C1'
+    ))
+
+    # Add growth line
+    fig3.add_trace(go.Scatter(
+        x=konsumsi_rt['Triwulan'],
+        y=konsumsi_rt['Pertumbuhan'] * 5000,  # Scale for visualization
+        name='Pertumbuhan (%)',
+        yaxis='y2',
+        line=dict(color='#E74C3C', width=3),
+        mode='lines+markers'
+    ))
+
+    fig3.update_layout(
+        title='Konsumsi Rumah Tangga & Pertumbuhan',
+        yaxis=dict(title='Nilai (Miliar Rupiah)'),
+        yaxis2=dict(
+            title='Pertumbuhan (%)',
+            overlaying='y',
+            side='right',
+            range=[0, 30]
+        ),
+        hovermode='x unified'
+    )
+    return fig3
+
+
+def government_consumption_figure(konsumsi_gov_data):
+    """Chart 4: konsumsi pemerintah per triwulan"""
+    fig4 = px.bar(konsumsi_gov_data, x='Triwulan', y='Nilai',
+                 title='Konsumsi Pemerintah per Triwulan',
+                 color='Nilai',
+                 color_continuous_scale='Viridis')
+
+    fig4.update_layout(
+        yaxis_title="Nilai (Miliar Rupiah)",
+        xaxis_title="Triwulan"
+    )
+    return fig4
+
+
+def consumption_growth_figure(growth_comparison):
+    """Chart 5: pertumbuhan YoY konsumsi"""
+    fig5 = px.bar(growth_comparison, x='Triwulan', y='Pertumbuhan', color='Komponen',
+                 barmode='group', title='Pertumbuhan YoY Konsumsi')
+    fig5.update_layout(
+        yaxis_title="Pertumbuhan (%)",
+        xaxis_title="Triwulan"
+    )
+    return fig5
+
+
+def pmtb_area_figure(pmtb_data):
+    """Chart 6: akumulasi investasi (chart spec 'pmtb')"""
+    fig6 = px.area(pmtb_data, x='Triwulan', y='Nilai',
+                  title='Akumulasi Investasi (PMTB) 2025',
+                  color_discrete_sequence=['#27AE60'])
+
+    fig6.update_layout(
+        yaxis_title="Nilai (Miliar Rupiah)",
+        xaxis_title="Triwulan"
+    )
+    return fig6
+
+
+def pmtb_growth_gauge(pmtb_growth):
+    """Chart 7: gauge rata-rata pertumbuhan PMTB"""
+    fig7 = go.Figure(data=[
+        go.Indicator(
+            mode="gauge+number+delta",
+            value=pmtb_growth['Pertumbuhan'].mean(),
+            title={'text': "Rata-rata Pertumbuhan PMTB"},
+            delta={'reference': 3.0},
+            gauge={
+                'axis': {'range': [None, 10]},
+                'bar': {'color': "#2ECC71"},
+                'steps': [
+                    {'range': [0, 3], 'color': "lightgray"},
+                    {'range': [3, 6], 'color': "gray"},
+                    {'range': [6, 10], 'color': "darkgray"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 6
+                }
+            }
+        )
+    ])
+
+    fig7.update_layout(height=300)
+    return fig7
+
+
+def investment_vs_consumption_figure(comparison_df):
+    """Chart 8: skala investasi vs konsumsi RT"""
+    fig8 = px.scatter(comparison_df, x='Triwulan', y='Nilai', color='Komponen',
+                     size='Nilai', hover_name='Komponen',
+                     title='Perbandingan Skala: Investasi vs Konsumsi RT')
+
+    fig8.update_layout(
+        yaxis_title="Nilai (Miliar Rupiah)",
+        xaxis_title="Triwulan"
+    )
+    return fig8
+
+
+def correlation_matrix(corr_data):
+    """Matriks korelasi antar komponen dengan label singkat"""
+    corr_pivot = corr_data.pivot(index='Komponen', columns='Triwulan', values='Nilai')
+    corr_matrix = corr_pivot.T.corr()
+
+    # Shorten labels
+    corr_matrix.index = [k.replace('Pengeluaran Konsumsi ', '').replace('Pembentukan ', '')
+                        for k in corr_matrix.index]
+    corr_matrix.columns = corr_matrix.index
+    return corr_matrix
+
+
+def linear_projection(values, steps=1):
+    """Proyeksi tren linear (kuadrat terkecil bentuk tertutup) untuk triwulan berikutnya"""
+    y = np.asarray(values, dtype=float)
+    x = np.arange(1, len(y) + 1)
+    dx = x - x.mean()
+    slope = (dx * (y - y.mean())).sum() / (dx ** 2).sum()
+    return y.mean() + slope * (len(y) + steps - x.mean())
+
+
+def correlation_figure(corr_matrix):
+    """Chart 9: heatmap korelasi"""
+    fig9 = px.imshow(corr_matrix,
+                    text_auto='.2f',
+                    aspect="auto",
+                    color_continuous_scale='RdBu',
+                    title='Matriks Korelasi Antar Komponen Ekonomi')
+    return fig9
+
+
+def gentrification_map_figure(geojson, indicators, indikator, level):
+    """Peta choropleth indikator gentrifikasi per kecamatan/kelurahan (tanpa basemap online)"""
+    fig = px.choropleth(indicators, geojson=geojson,
+                        locations=ID_PROPERTY, featureidkey=f'properties.{ID_PROPERTY}',
+                        color=indikator, hover_name=NAME_PROPERTY,
+                        color_continuous_scale='YlOrRd',
+                        title=f'{indikator.replace("_", " ").title()} per {level.title()} DKI Jakarta')
+    fig.update_geos(fitbounds='locations', visible=False)
+    fig.update_layout(height=600, margin=dict(l=0, r=0, t=50, b=0))
+    return fig
+
+
+def monthly_indicator_figure(series, indikator):
+    """Indikator bulanan: nilai (garis) + pertumbuhan YoY (batang, sumbu kanan)"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=series['Periode'], y=series['YoY'], name='YoY (%)',
+                         marker_color='#c7d2fe', yaxis='y2'))
+    fig.add_trace(go.Scatter(x=series['Periode'], y=series['Nilai'], name=indikator,
+                             mode='lines+markers', line=dict(color='#1E3A8A', width=3)))
+    fig.update_layout(
+        title=f'{indikator} Bulanan',
+        xaxis_title="Periode",
+        yaxis=dict(title="Nilai"),
+        yaxis2=dict(title="YoY (%)", overlaying='y', side='right', showgrid=False),
+        legend=dict(orientation='h', y=-0.2),
+        height=350
+    )
+    return fig
@@ -0,0 +1,41 @@
+# dashboard/formatting.py
+import numpy as np
+import pandas as pd
+
+# Aturan format Rupiah: (batas bawah, pembagi, akhiran), dicek berurutan
+RUPIAH_SCALES = [
+    (1e12, 1e12, 'T'),
+    (1e9, 1e9, 'M'),
+    (1e6, 1e6, 'M'),
+]
+
+
+# Fungsi format Rupiah (skalar, dipakai FuncFormatter matplotlib)
+def format_rupiah(x, pos=None):
+    for threshold, divisor, suffix in RUPIAH_SCALES:
+        if x >= threshold:
+            return f'Rp{x/divisor:.1f}{suffix}'
+    return f'Rp{x:,.0f}'
+
+
+def format_rupiah_series(values):
+    """Versi kolom dari format_rupiah: skala dipilih vektor, string dibuat sekali jalan; NaN -> '-'"""
+    values = pd.to_numeric(pd.Series(values), errors='coerce')
+    x = values.to_numpy(dtype=float)
+    scale = np.select([x >= threshold for threshold, _, _ in RUPIAH_SCALES],
+                      range(len(RUPIAH_SCALES)), len(RUPIAH_SCALES))
+    divisors = np.array([divisor for _, divisor, _ in RUPIAH_SCALES] + [1.0])
+    suffixes = [suffix for _, _, suffix in RUPIAH_SCALES]
+
+    # np.char.mod juga loop per elemen dan lebih lambat dari list comprehension
+    out = ['-' if v != v else f'Rp{v:.1f}{suffixes[s]}' if s < len(suffixes) else f'Rp{v:,.0f}'
+           for v, s in zip((x / divisors[scale]).tolist(), scale.tolist())]
+    return pd.Series(out, index=values.index, dtype=object)
+
+
+def format_number_series(values, pattern='{:,.2f}'):
+    """Format satu kolom dengan pola str.format ('{:+,.2f}') atau printf ('%.2f'); NaN -> '-'"""
+    values = pd.to_numeric(pd.Series(values), errors='coerce')
+    fmt = pattern.format if '{' in pattern else pattern.__mod__
+    out = ['-' if v != v else fmt(v) for v in values.to_numpy(dtype=float).tolist()]
+    return pd.Series(out, index=values.index, dtype=object)
@@ -0,0 +1,286 @@
+# dashboard/geo_map.py
+"""Peta gentrifikasi tingkat kecamatan/kelurahan dari file lokal (offline).
+
+File sumber di folder geo/:
+    jakarta_kecamatan.geojson, jakarta_kelurahan.geojson   batas wilayah (properti 'kode', 'nama')
+    indikator_kecamatan.csv, indikator_kelurahan.csv       kolom 'kode' + kolom indikator numerik
+
+File yang ada di repo adalah fixture sintetis (grid "Contoh Kecamatan/Kelurahan"
+di sekitar bbox Jakarta) supaya tab peta bisa dipakai dan dicek; ganti dengan
+batas wilayah BPS dan indikator asli dengan nama file yang sama. Selama fixture
+yang dimuat, dashboard menampilkan peringatan bahwa datanya bukan data asli.
+
+Geometri diproses sekali per file sumber: koordinat dikuantisasi dan batas yang
+dipakai bersama dua wilayah dijadikan satu arc, lalu tiap arc disederhanakan
+(Douglas-Peucker) untuk setiap tingkat zoom. Karena satu batas hanya
+disederhanakan sekali, wilayah bertetangga tidak bercelah/bertumpuk. Hasilnya
+disimpan sebagai GeoJSON per zoom di geo/cache/; Plotly hanya menerima GeoJSON,
+jadi pengurangan ukuran yang sampai ke browser berasal dari penyederhanaan.
+
+    python geo_map.py build
+"""
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+GEO_DIR = 'geo'
+CACHE_SUBDIR = 'cache'
+
+GEO_LEVELS = {
+    'kecamatan': {'geometry': 'jakarta_kecamatan.geojson', 'indicators': 'indikator_kecamatan.csv'},
+    'kelurahan': {'geometry': 'jakarta_kelurahan.geojson', 'indicators': 'indikator_kelurahan.csv'},
+}
+ID_PROPERTY = 'kode'
+NAME_PROPERTY = 'nama'
+
+# Nama wilayah di fixture sintetis (lihat docstring modul)
+FIXTURE_NAME_PREFIX = 'Contoh '
+
+# Toleransi penyederhanaan (derajat) per tingkat zoom peta
+ZOOM_TOLERANCES = {10: 0.002, 12: 0.0005, 14: 0.0001}
+QUANTIZATION = 100000
+
+
+def source_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+
+def _polygons(geometry):
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates']]
+    if geometry['type'] == 'MultiPolygon':
+        return geometry['coordinates']
+    return []
+
+
+def _dedupe(ring):
+    """Buang titik berurutan yang sama setelah kuantisasi, ring tetap tertutup"""
+    points = [ring[0]]
+    for p in ring[1:]:
+        if p != points[-1]:
+            points.append(p)
+    if points[0] != points[-1]:
+        points.append(points[0])
+    return points
+
+
+def _canonical_ring(points):
+    """Rotasi ring tertutup agar mulai dari titik terkecil (untuk dedup arc)"""
+    body = points[:-1]
+    start = body.index(min(body))
+    body = body[start:] + body[:start]
+    return tuple(body + [body[0]])
+
+
+def build_topology(geojson, quantization=QUANTIZATION):
+    """GeoJSON -> topologi: koordinat terkuantisasi, batas bersama jadi satu arc"""
+    coords = np.array([pt for f in geojson['features'] for poly in _polygons(f['geometry'])
+                       for ring in poly for pt in ring], dtype=float)[:, :2]
+    x0, y0 = coords.min(axis=0)
+    x1, y1 = coords.max(axis=0)
+    kx = (x1 - x0) / (quantization - 1) or 1.0
+    ky = (y1 - y0) / (quantization - 1) or 1.0
+
+    def quantize(ring):
+        q = np.rint((np.asarray(ring, dtype=float)[:, :2] - [x0, y0]) / [kx, ky]).astype(int)
+        return _dedupe([tuple(p) for p in q.tolist()])
+
+    features = []
+    for f in geojson['features']:
+        polygons = [[quantize(ring) for ring in poly] for poly in _polygons(f['geometry'])]
+        features.append((f.get('properties') or {}, polygons))
+
+    # Junction: titik yang dilewati beberapa ring dengan tetangga berbeda
+    neighbours = {}
+    junctions = set()
+    for _, polygons in features:
+        for poly in polygons:
+            for ring in poly:
+                body = ring[:-1]
+                n = len(body)
+                for i, p in enumerate(body):
+                    pair = frozenset((body[i - 1], body[(i + 1) % n]))
+                    seen = neighbours.setdefault(p, pair)
+                    if seen != pair:
+                        junctions.add(p)
+
+    arcs = []
+    arc_index = {}
+
+    def arc_ref(points, closed=False):
+        key = _canonical_ring(list(points)) if closed else tuple(points)
+        rev = _canonical_ring(list(reversed(points))) if closed else tuple(reversed(points))
+        if key in arc_index:
+            return arc_index[key]
+        if rev in arc_index:
+            return ~arc_index[rev]
+        arc_index[key] = len(arcs)
+        arcs.append(list(key))
+        return arc_index[key]
+
+    def ring_arcs(ring):
+        body = ring[:-1]
+        cuts = [i for i, p in enumerate(body) if p in junctions]
+        if not cuts:
+            return [arc_ref(ring, closed=True)]
+        body = body[cuts[0]:] + body[:cuts[0]]
+        cuts = [c - cuts[0] for c in cuts] + [len(body)]
+        body = body + [body[0]]
+        return [arc_ref(body[a:b + 1]) for a, b in zip(cuts[:-1], cuts[1:])]
+
+    geometries = []
+    for properties, polygons in features:
+        geometries.append({
+            'type': 'MultiPolygon',
+            'arcs': [[ring_arcs(ring) for ring in poly] for poly in polygons],
+            'properties': {k: properties.get(k) for k in (ID_PROPERTY, NAME_PROPERTY)},
+        })
+
+    return {
+        'transform': {'scale': [kx, ky], 'translate': [float(x0), float(y0)]},
+        'geometries': geometries,
+        'arcs': arcs,
+    }
+
+
+def simplify_arc(points, tolerance):
+    """Douglas-Peucker untuk satu arc; titik ujung (junction) selalu dipertahankan"""
+    pts = np.asarray(points, dtype=float)
+    if len(pts) <= 2:
+        return points
+    if tuple(points[0]) == tuple(points[-1]):
+        # Arc tertutup: pecah di titik terjauh supaya ring tidak kolaps
+        far = int(np.argmax(((pts - pts[0]) ** 2).sum(axis=1)))
+        return simplify_arc(points[:far + 1], tolerance)[:-1] + simplify_arc(points[far:], tolerance)
+
+    keep = np.zeros(len(pts), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        seg = pts[b] - pts[a]
+        rel = pts[a + 1:b] - pts[a]
+        length = np.hypot(*seg)
+        if length == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / length
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            keep[a + 1 + i] = True
+            stack.extend([(a, a + 1 + i), (a + 1 + i, b)])
+    return [points[i] for i in np.flatnonzero(keep)]
+
+
+def simplified_geojson(topology, tolerance):
+    """Topologi -> GeoJSON FeatureCollection dengan arc disederhanakan (untuk Plotly)"""
+    kx, ky = topology['transform']['scale']
+    x0, y0 = topology['transform']['translate']
+    tol = tolerance / min(kx, ky)
+    arcs = [(np.asarray(simplify_arc(arc, tol), dtype=float) * [kx, ky] + [x0, y0]).round(6).tolist()
+            for arc in topology['arcs']]
+
+    def ring(refs, exterior):
+        points = []
+        for ref in refs:
+            arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+            points.extend(arc if not points else arc[1:])
+        # Plotly (d3-geo) butuh ring luar searah jarum jam, lubang sebaliknya
+        xy = np.asarray(points)
+        area = np.sum(xy[:-1, 0] * xy[1:, 1] - xy[1:, 0] * xy[:-1, 1])
+        return points[::-1] if (area > 0) == exterior else points
+
+    features = []
+    for geom in topology['geometries']:
+        features.append({
+            'type': 'Feature',
+            'id': geom['properties'].get(ID_PROPERTY),
+            'properties': geom['properties'],
+            'geometry': {
+                'type': 'MultiPolygon',
+                'coordinates': [[ring(r, i == 0) for i, r in enumerate(poly)] for poly in geom['arcs']],
+            },
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def cache_path(level, zoom, digest, cache_dir):
+    return os.path.join(cache_dir, f'{level}_z{zoom}_{digest}.geojson')
+
+
+def build_map_cache(level, geo_dir=GEO_DIR):
+    """Precompute GeoJSON tersederhanakan per tingkat zoom di <geo_dir>/cache; dilewati jika sudah ada"""
+    source = os.path.join(geo_dir, GEO_LEVELS[level]['geometry'])
+    cache_dir = os.path.join(geo_dir, CACHE_SUBDIR)
+    digest = source_hash(source)
+    paths = {zoom: cache_path(level, zoom, digest, cache_dir) for zoom in ZOOM_TOLERANCES}
+    if all(os.path.exists(p) for p in paths.values()):
+        return paths
+
+    with open(source, encoding='utf-8') as f:
+        topology = build_topology(json.load(f))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for zoom, tolerance in ZOOM_TOLERANCES.items():
+        # Tulis ke .tmp lalu rename: sesi lain tidak pernah membaca file setengah jadi
+        with open(paths[zoom] + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(simplified_geojson(topology, tolerance), f, separators=(',', ':'))
+        os.replace(paths[zoom] + '.tmp', paths[zoom])
+    return paths
+
+
+def available_levels(geo_dir=GEO_DIR):
+    """Tingkat wilayah yang file geometri dan indikatornya tersedia"""
+    return [level for level, files in GEO_LEVELS.items()
+            if all(os.path.exists(os.path.join(geo_dir, name)) for name in files.values())]
+
+
+def load_map(level, zoom, geo_dir=GEO_DIR):
+    """GeoJSON tersederhanakan untuk zoom tertentu + frame indikator per wilayah"""
+    if level not in available_levels(geo_dir):
+        return None, None
+
+    paths = build_map_cache(level, geo_dir)
+    with open(paths[zoom], encoding='utf-8') as f:
+        geojson = json.load(f)
+
+    indicators = pd.read_csv(os.path.join(geo_dir, GEO_LEVELS[level]['indicators']),
+                             dtype={ID_PROPERTY: str})
+    names = pd.DataFrame([f['properties'] for f in geojson['features']]).astype({ID_PROPERTY: str})
+    indicators = names.merge(indicators.drop(columns=[NAME_PROPERTY], errors='ignore'),
+                             on=ID_PROPERTY, how='left')
+    return geojson, indicators
+
+
+def is_fixture(indicators):
+    """True jika wilayah yang dimuat berasal dari fixture sintetis, bukan data asli"""
+    names = indicators[NAME_PROPERTY].dropna().astype(str)
+    return not names.empty and names.str.startswith(FIXTURE_NAME_PREFIX).all()
+
+
+def indicator_columns(indicators):
+    return [c for c in indicators.columns
+            if c not in (ID_PROPERTY, NAME_PROPERTY) and pd.api.types.is_numeric_dtype(indicators[c])]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute geometri peta gentrifikasi")
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--geo-dir', default=GEO_DIR, help="Folder GeoJSON + CSV indikator")
+    args = parser.parse_args()
+
+    levels = available_levels(args.geo_dir)
+    if not levels:
+        print(f"❌ Tidak ada file geometri/indikator di '{args.geo_dir}/'")
+    for level in levels:
+        source = os.path.join(args.geo_dir, GEO_LEVELS[level]['geometry'])
+        for zoom, path in build_map_cache(level, args.geo_dir).items():
+            print(f"✅ {level} z{zoom}: {os.path.getsize(path) / 1024:.1f} KB "
+                  f"(sumber {os.path.getsize(source) / 1024:.1f} KB)")
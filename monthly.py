@@ -0,0 +1,291 @@
+# dashboard/monthly.py
+"""Indikator bulanan (IHK, harga properti, penjualan eceran, ...) secara append-only.
+
+File CSV baru diletakkan di folder masuk/ dengan kolom Indikator, Periode
+(YYYY-MM) dan Nilai. Setiap ingest hanya memproses file yang belum pernah
+dibaca dan hanya periode setelah periode terakhir tiap indikator; pertumbuhan
+MoM/YoY dan agregat triwulanan dihitung dari baris baru saja, dengan state
+(12 nilai terakhir + jumlah/banyak per triwulan) yang disimpan di state.json.
+Baris untuk bulan yang sudah di-ingest tidak ditimpa; nilai yang berbeda
+dilaporkan sebagai konflik. File tanpa kolom wajib (atau bukan CSV yang valid)
+ditolak dan dicatat di state, file lain tetap di-ingest.
+
+state.json adalah titik commit: ukuran CSV seri yang sudah ter-commit dicatat
+di sana, dan baris yang ter-append tanpa state tersimpan (mis. proses mati di
+tengah ingest) dipotong lalu file masuknya diproses ulang.
+
+    python monthly.py ingest
+    python monthly.py status
+"""
+import argparse
+import json
+import os
+import threading
+
+import pandas as pd
+
+from data_loader import DATA_DIR
+
+MONTHLY_DIR = os.path.join(DATA_DIR, 'bulanan')
+INBOX = 'masuk'
+SERIES_FILE = 'indikator_bulanan.csv'
+STATE_FILE = 'state.json'
+
+SERIES_COLUMNS = ['Indikator', 'Periode', 'Triwulan', 'Nilai', 'MoM', 'YoY']
+DROP_COLUMNS = ['Indikator', 'Periode', 'Nilai']
+
+# Interval cek file baru dari dashboard (detik)
+REFRESH_SECONDS = 60
+
+# Cukup 12 bulan terakhir per indikator untuk menghitung YoY baris berikutnya
+HISTORY_MONTHS = 12
+
+# Satu ingest pada satu waktu (beberapa sesi dashboard berbagi proses)
+_LOCK = threading.Lock()
+
+# Seri yang sudah dibaca, per folder: {'rows': n, 'frame': df}
+_SERIES = {}
+
+
+def _new_state():
+    return {'revision': 0, 'rows': 0, 'bytes': 0, 'files': {}, 'indikator': {}, 'konflik': [],
+            'ditolak': {}}
+
+
+def load_state(monthly_dir=MONTHLY_DIR):
+    path = os.path.join(monthly_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return _new_state()
+    with open(path, encoding='utf-8') as f:
+        state = json.load(f)
+    # State lama (sebelum ada titik commit): anggap seluruh CSV sudah ter-commit
+    if 'bytes' not in state:
+        series_path = os.path.join(monthly_dir, SERIES_FILE)
+        state['bytes'] = os.path.getsize(series_path) if os.path.exists(series_path) else 0
+    state.setdefault('konflik', [])
+    state.setdefault('ditolak', {})
+    return state
+
+
+def save_state(state, monthly_dir=MONTHLY_DIR):
+    os.makedirs(monthly_dir, exist_ok=True)
+    path = os.path.join(monthly_dir, STATE_FILE)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def _file_stamp(path):
+    stat = os.stat(path)
+    return f'{stat.st_size}-{int(stat.st_mtime)}'
+
+
+def pending_files(state, monthly_dir=MONTHLY_DIR):
+    """File di folder masuk/ yang belum pernah di-ingest (nama + ukuran + waktu ubah)"""
+    inbox = os.path.join(monthly_dir, INBOX)
+    if not os.path.isdir(inbox):
+        return []
+    return [os.path.join(inbox, name) for name in sorted(os.listdir(inbox))
+            if name.endswith('.csv')
+            and state['files'].get(name) != _file_stamp(os.path.join(inbox, name))]
+
+
+def read_drop_file(path):
+    """CSV masuk -> (Indikator, Periode 'YYYY-MM', Nilai numerik), baris rusak dibuang.
+
+    ValueError jika file tidak bisa dibaca sebagai CSV atau kolom wajib tidak ada.
+    """
+    raw = pd.read_csv(path, dtype={'Indikator': str, 'Periode': str})
+    missing = [c for c in DROP_COLUMNS if c not in raw.columns]
+    if missing:
+        raise ValueError(f"kolom {', '.join(missing)} tidak ada")
+    df = pd.DataFrame({
+        'Indikator': raw['Indikator'].str.strip(),
+        'Periode': pd.to_datetime(raw['Periode'], errors='coerce').dt.to_period('M'),
+        'Nilai': pd.to_numeric(raw['Nilai'], errors='coerce'),
+    })
+    return df.dropna().drop_duplicates(['Indikator', 'Periode'], keep='last')
+
+
+def append_indicator(entry, rows):
+    """Tambah baris baru satu indikator; pertumbuhan dihitung dari state + baris baru saja.
+
+    Kembalikan (baris baru, entry, baris yang dilewati karena bulannya sudah lewat).
+    """
+    skipped = rows.iloc[:0]
+    if entry['last'] is not None:
+        old = rows['Periode'] <= pd.Period(entry['last'], 'M')
+        rows, skipped = rows[~old], rows[old]
+    if rows.empty:
+        return rows.reindex(columns=SERIES_COLUMNS), entry, skipped
+
+    # Riwayat pendek + baris baru, direindex bulanan supaya bulan kosong jadi NaN
+    history = pd.Series({pd.Period(p, 'M'): v for p, v in entry['recent']}, dtype=float)
+    new = rows.set_index('Periode')['Nilai'].sort_index()
+    combined = pd.concat([history, new])
+    combined = combined.reindex(pd.period_range(combined.index.min(), combined.index.max(), freq='M'))
+
+    mom = (combined / combined.shift(1) - 1) * 100
+    yoy = (combined / combined.shift(12) - 1) * 100
+    out = pd.DataFrame({
+        'Indikator': rows['Indikator'].iat[0],
+        'Periode': new.index.astype(str),
+        'Triwulan': [f'{p.year}Q{p.quarter}' for p in new.index],
+        'Nilai': new.to_numpy(),
+        'MoM': mom.reindex(new.index).to_numpy(),
+        'YoY': yoy.reindex(new.index).to_numpy(),
+    })
+
+    tail = combined.dropna().iloc[-HISTORY_MONTHS:]
+    entry['recent'] = [[str(p), float(v)] for p, v in tail.items()]
+    entry['last'] = str(new.index.max())
+    for triwulan, group in out.groupby('Triwulan')['Nilai']:
+        total, count = entry['triwulan'].get(triwulan, [0.0, 0])
+        entry['triwulan'][triwulan] = [total + float(group.sum()), count + int(group.count())]
+    entry['revision'] += 1
+    return out, entry, skipped
+
+
+def classify_skipped(skipped, series):
+    """Bandingkan baris yang dilewati dengan seri tersimpan: sama / revisi / terlambat"""
+    stored = series[['Indikator', 'Periode', 'Nilai']].rename(columns={'Nilai': 'Nilai Lama'})
+    rows = skipped.assign(Periode=skipped['Periode'].astype(str)).rename(columns={'Nilai': 'Nilai Baru'})
+    rows = rows.merge(stored, on=['Indikator', 'Periode'], how='left')
+    rows['Status'] = 'revisi'
+    rows.loc[(rows['Nilai Baru'] - rows['Nilai Lama']).abs() <= 1e-9, 'Status'] = 'sama'
+    rows.loc[rows['Nilai Lama'].isna(), 'Status'] = 'terlambat'
+    return rows[['Indikator', 'Periode', 'Nilai Lama', 'Nilai Baru', 'Status']]
+
+
+def _truncate_uncommitted(state, path):
+    """Buang baris CSV yang ter-append setelah state.json terakhir tersimpan"""
+    if os.path.exists(path) and os.path.getsize(path) > state['bytes']:
+        os.truncate(path, state['bytes'])
+
+
+def ingest(monthly_dir=MONTHLY_DIR):
+    """Proses file baru di masuk/.
+
+    Kembalikan {'baru': {indikator: jumlah baris baru}, 'sama': jumlah baris
+    duplikat, 'konflik': [baris revisi/terlambat yang tidak di-ingest],
+    'ditolak': {file: alasan}}. File yang ditolak tetap dicatat di state['files']
+    sehingga tidak dibaca ulang sampai isinya diganti.
+    """
+    result = {'baru': {}, 'sama': 0, 'konflik': [], 'ditolak': {}}
+    with _LOCK:
+        state = load_state(monthly_dir)
+        files = pending_files(state, monthly_dir)
+        # File ditolak yang sudah dihapus dari masuk/ tidak perlu dilaporkan lagi
+        inbox = os.path.join(monthly_dir, INBOX)
+        gone = [name for name in state['ditolak'] if not os.path.exists(os.path.join(inbox, name))]
+        for name in gone:
+            del state['ditolak'][name]
+        if not files:
+            if gone:
+                save_state(state, monthly_dir)
+            return result
+
+        path = os.path.join(monthly_dir, SERIES_FILE)
+        _truncate_uncommitted(state, path)
+
+        frames = []
+        for p in files:
+            name = os.path.basename(p)
+            try:
+                frames.append(read_drop_file(p))
+                state['ditolak'].pop(name, None)
+            except ValueError as e:
+                result['ditolak'][name] = state['ditolak'][name] = str(e)
+        rows = (pd.concat(frames, ignore_index=True) if frames
+                else pd.DataFrame(columns=DROP_COLUMNS))
+        rows = rows.drop_duplicates(['Indikator', 'Periode'], keep='last')
+        appended, skipped = [], []
+        for indikator, group in rows.groupby('Indikator'):
+            entry = state['indikator'].get(indikator) or {
+                'revision': 0, 'last': None, 'recent': [], 'triwulan': {}}
+            out, state['indikator'][indikator], old = append_indicator(entry, group)
+            if not out.empty:
+                appended.append(out)
+            if not old.empty:
+                skipped.append(old)
+
+        if skipped:
+            checked = classify_skipped(pd.concat(skipped, ignore_index=True),
+                                       load_series(monthly_dir, state))
+            result['sama'] = int((checked['Status'] == 'sama').sum())
+            result['konflik'] = checked[checked['Status'] != 'sama'].to_dict('records')
+        state['konflik'] = result['konflik']
+
+        if appended:
+            new_rows = pd.concat(appended, ignore_index=True)
+            new_rows.to_csv(path, mode='a', index=False,
+                            header=not os.path.exists(path) or os.path.getsize(path) == 0)
+            state['rows'] += len(new_rows)
+            state['bytes'] = os.path.getsize(path)
+            state['revision'] += 1
+            result['baru'] = new_rows['Indikator'].value_counts().to_dict()
+
+        for p in files:
+            state['files'][os.path.basename(p)] = _file_stamp(p)
+        # Commit: sampai state tersimpan, baris baru di CSV dianggap belum ada
+        save_state(state, monthly_dir)
+        return result
+
+
+def load_series(monthly_dir=MONTHLY_DIR, state=None):
+    """Seluruh seri bulanan; hanya baris yang ditambahkan sejak pembacaan terakhir yang di-parse"""
+    state = state or load_state(monthly_dir)
+    cached = _SERIES.get(monthly_dir, {'rows': 0, 'frame': pd.DataFrame(columns=SERIES_COLUMNS)})
+    if state['rows'] > cached['rows']:
+        # nrows: hanya baris yang sudah ter-commit di state
+        new_rows = pd.read_csv(os.path.join(monthly_dir, SERIES_FILE),
+                               skiprows=range(1, cached['rows'] + 1),
+                               nrows=state['rows'] - cached['rows'],
+                               dtype={'Indikator': str, 'Periode': str, 'Triwulan': str})
+        frame = new_rows if cached['frame'].empty else pd.concat([cached['frame'], new_rows],
+                                                                 ignore_index=True)
+        cached = {'rows': cached['rows'] + len(new_rows), 'frame': frame}
+        _SERIES[monthly_dir] = cached
+    return cached['frame']
+
+
+def indicator_series(indikator, monthly_dir=MONTHLY_DIR):
+    series = load_series(monthly_dir)
+    return series[series['Indikator'] == indikator].reset_index(drop=True)
+
+
+def quarterly_averages(state):
+    """Rata-rata triwulanan per indikator langsung dari jumlah/banyak di state"""
+    rows = [(indikator, triwulan, total / count)
+            for indikator, entry in state['indikator'].items()
+            for triwulan, (total, count) in entry['triwulan'].items() if count]
+    return (pd.DataFrame(rows, columns=['Indikator', 'Triwulan', 'Rata-rata'])
+              .sort_values(['Indikator', 'Triwulan']).reset_index(drop=True))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest indikator bulanan (append-only)")
+    parser.add_argument('command', choices=['ingest', 'status'])
+    parser.add_argument('--dir', default=MONTHLY_DIR, help="Folder indikator bulanan")
+    args = parser.parse_args()
+
+    if args.command == 'ingest':
+        result = ingest(args.dir)
+        for name, reason in result['ditolak'].items():
+            print(f"❌ {name} ditolak: {reason}")
+        if not result['baru']:
+            print("✅ Tidak ada periode baru")
+        for indikator, n in result['baru'].items():
+            print(f"✅ {indikator}: +{n} bulan")
+        if result['sama']:
+            print(f"ℹ️ {result['sama']} baris sudah ada dengan nilai sama, dilewati")
+        for row in result['konflik']:
+            print(f"⚠️ {row['Indikator']} {row['Periode']}: {row['Status']} "
+                  f"(tersimpan {row['Nilai Lama']}, file {row['Nilai Baru']}) tidak di-ingest")
+    else:
+        state = load_state(args.dir)
+        print(f"Revisi {state['revision']}, {state['rows']} baris, {len(state['files'])} file")
+        for name, reason in state['ditolak'].items():
+            print(f"  ❌ {name} ditolak: {reason}")
+        for indikator, entry in state['indikator'].items():
+            print(f"  {indikator:<25} s.d. {entry['last']}  (revisi {entry['revision']})")
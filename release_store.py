@@ -0,0 +1,196 @@
+# dashboard/release_store.py
+"""Release store PDRB: riwayat rilis BPS yang direvisi, disimpan sebagai delta.
+
+Rilis pertama disimpan utuh (snapshot), rilis berikutnya hanya baris yang
+baru/direvisi/hilang dibanding rilis sebelumnya. Setiap SNAPSHOT_EVERY rilis
+disimpan snapshot lagi supaya rekonstruksi vintage tidak perlu memutar
+seluruh riwayat.
+
+    python release_store.py record --data-dir ../data
+    python release_store.py list
+    python release_store.py diff
+"""
+import argparse
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from data_loader import DATA_DIR, data_version, read_pdrb_data
+
+STORE_DIR = os.path.join(DATA_DIR, 'releases')
+SNAPSHOT_EVERY = 10
+
+KEY_COLUMNS = ['Seri', 'Komponen', 'Triwulan']
+
+# Vintage yang sudah direkonstruksi, per (store_dir, id rilis)
+_VINTAGES = {}
+
+
+def release_frame(df_laju, df_pdrb_full):
+    """Satu frame long (Seri, Komponen, Triwulan, Nilai) untuk disimpan per rilis"""
+    nilai = df_pdrb_full.assign(Seri='Nilai')[KEY_COLUMNS + ['Nilai']]
+    laju = df_laju.assign(Seri='Pertumbuhan').rename(columns={'Pertumbuhan': 'Nilai'})[KEY_COLUMNS + ['Nilai']]
+    frame = pd.concat([nilai, laju], ignore_index=True)
+    return frame.sort_values(KEY_COLUMNS).reset_index(drop=True)
+
+
+def compute_delta(old, new):
+    """Baris yang berbeda antara dua vintage, dengan Status baru/revisi/hapus"""
+    merged = old.merge(new, on=KEY_COLUMNS, how='outer', suffixes=('_lama', ''), indicator=True)
+    added = merged['_merge'] == 'right_only'
+    removed = merged['_merge'] == 'left_only'
+    revised = (merged['_merge'] == 'both') & ~(
+        (merged['Nilai'] - merged['Nilai_lama']).abs().le(1e-9)
+        | (merged['Nilai'].isna() & merged['Nilai_lama'].isna()))
+
+    delta = merged[added | removed | revised].copy()
+    delta['Status'] = 'revisi'
+    delta.loc[added, 'Status'] = 'baru'
+    delta.loc[removed, 'Status'] = 'hapus'
+    return delta[KEY_COLUMNS + ['Nilai', 'Status']].reset_index(drop=True)
+
+
+def apply_delta(base, delta):
+    """Terapkan delta ke vintage sebelumnya"""
+    keys = pd.MultiIndex.from_frame(delta[KEY_COLUMNS])
+    kept = base[~pd.MultiIndex.from_frame(base[KEY_COLUMNS]).isin(keys)]
+    upserts = delta.loc[delta['Status'] != 'hapus', KEY_COLUMNS + ['Nilai']]
+    frame = pd.concat([kept, upserts], ignore_index=True)
+    return frame.sort_values(KEY_COLUMNS).reset_index(drop=True)
+
+
+def load_manifest(store_dir=STORE_DIR):
+    path = os.path.join(store_dir, 'manifest.json')
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, store_dir=STORE_DIR):
+    os.makedirs(store_dir, exist_ok=True)
+    path = os.path.join(store_dir, 'manifest.json')
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def _read_csv(store_dir, filename):
+    return pd.read_csv(os.path.join(store_dir, filename),
+                       dtype={'Seri': str, 'Komponen': str, 'Triwulan': str})
+
+
+def load_vintage(release_id=None, store_dir=STORE_DIR):
+    """Rekonstruksi data persis seperti pada rilis tertentu (default: terbaru)"""
+    manifest = load_manifest(store_dir)
+    if not manifest:
+        return None
+    if release_id is None:
+        release_id = manifest[-1]['id']
+
+    cache_key = (store_dir, release_id)
+    if cache_key in _VINTAGES:
+        return _VINTAGES[cache_key].copy()
+
+    # Mulai dari snapshot terdekat, lalu terapkan delta sesudahnya
+    entries = [e for e in manifest if e['id'] <= release_id]
+    start = max(i for i, e in enumerate(entries) if e['snapshot'])
+    frame = _read_csv(store_dir, entries[start]['snapshot'])
+    for entry in entries[start + 1:]:
+        frame = apply_delta(frame, _read_csv(store_dir, entry['delta']))
+
+    _VINTAGES[cache_key] = frame
+    return frame.copy()
+
+
+def record_release(df_laju, df_pdrb_full, version, store_dir=STORE_DIR):
+    """Catat rilis baru sebagai delta; rilis yang sudah tercatat dilewati"""
+    manifest = load_manifest(store_dir)
+    if any(e['version'] == version for e in manifest):
+        return None
+
+    frame = release_frame(df_laju, df_pdrb_full)
+    release_id = manifest[-1]['id'] + 1 if manifest else 0
+    entry = {
+        'id': release_id,
+        'version': version,
+        'tanggal': datetime.now().isoformat(timespec='seconds'),
+        'snapshot': None,
+        'delta': None,
+    }
+    os.makedirs(store_dir, exist_ok=True)
+
+    if manifest:
+        delta = compute_delta(load_vintage(manifest[-1]['id'], store_dir), frame)
+        entry['delta'] = f'delta_{release_id:04d}_{version}.csv'
+        entry['perubahan'] = delta['Status'].value_counts().to_dict()
+        delta.to_csv(os.path.join(store_dir, entry['delta']), index=False)
+    if not manifest or release_id % SNAPSHOT_EVERY == 0:
+        entry['snapshot'] = f'snapshot_{release_id:04d}_{version}.csv'
+        frame.to_csv(os.path.join(store_dir, entry['snapshot']), index=False)
+
+    manifest.append(entry)
+    save_manifest(manifest, store_dir)
+    _VINTAGES[(store_dir, release_id)] = frame
+    return entry
+
+
+def release_for_version(version, store_dir=STORE_DIR):
+    """Entri manifest untuk versi data tertentu, None jika belum di-record"""
+    return next((e for e in load_manifest(store_dir) if e['version'] == version), None)
+
+
+def revisions(release_id=None, store_dir=STORE_DIR):
+    """Nilai yang berubah pada rilis tertentu dibanding rilis sebelumnya (default: terbaru)"""
+    manifest = load_manifest(store_dir)
+    if release_id is None:
+        if len(manifest) < 2:
+            return None
+        entry = manifest[-1]
+    else:
+        entry = next((e for e in manifest if e['id'] == release_id), None)
+        if entry is None:
+            raise ValueError(f"rilis #{release_id} tidak ada di release store '{store_dir}'")
+    if entry['delta'] is None:
+        return None
+
+    # Delta rilis itu sendiri sudah berisi semua perubahan; cukup tambah nilai lama
+    delta = _read_csv(store_dir, entry['delta'])
+    previous = load_vintage(entry['id'] - 1, store_dir)
+    changed = delta.merge(previous, on=KEY_COLUMNS, how='left', suffixes=('', '_lama'))
+    changed = changed.rename(columns={'Nilai': 'Nilai Baru', 'Nilai_lama': 'Nilai Lama'})
+    changed['Selisih'] = changed['Nilai Baru'] - changed['Nilai Lama']
+    changed['Selisih (%)'] = changed['Selisih'] / changed['Nilai Lama'].abs() * 100
+    return changed[KEY_COLUMNS + ['Status', 'Nilai Lama', 'Nilai Baru', 'Selisih', 'Selisih (%)']]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Release store PDRB (delta per rilis)")
+    parser.add_argument('command', choices=['record', 'list', 'diff'])
+    parser.add_argument('--data-dir', default=DATA_DIR, help="Folder file Excel BPS")
+    parser.add_argument('--store', default=STORE_DIR, help="Folder release store")
+    parser.add_argument('--release', type=int, default=None, help="Id rilis (default: terbaru)")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        df_yoy, df_nilai, df_laju, df_pdrb_full = read_pdrb_data(args.data_dir)
+        entry = record_release(df_laju, df_pdrb_full, data_version(args.data_dir), args.store)
+        if entry is None:
+            print("✅ Rilis ini sudah tercatat")
+        else:
+            print(f"✅ Rilis #{entry['id']} ({entry['version']}) tercatat: {entry.get('perubahan', 'snapshot awal')}")
+    elif args.command == 'list':
+        for entry in load_manifest(args.store):
+            kind = 'snapshot' if entry['snapshot'] else 'delta'
+            print(f"#{entry['id']:<4} {entry['version']}  {entry['tanggal']}  {kind}  {entry.get('perubahan', '')}")
+    else:
+        try:
+            changed = revisions(args.release, args.store)
+        except ValueError as e:
+            parser.error(str(e))
+        if changed is None:
+            print("Belum ada rilis sebelumnya untuk dibandingkan")
+        else:
+            print(changed.to_string(index=False))
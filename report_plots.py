@@ -4,7 +4,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.ticker import FuncFormatter
+from matplotlib.backends.backend_pdf import PdfPages
+from chart_specs import resolve_charts
+from data_loader import KOMPONEN_RINGKAS, file_version
+from formatting import format_rupiah  # Fungsi format Rupiah
+from validation import DataValidationError, require_valid, validate_long, validation_report
 import os
+import time
+import argparse
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -12,51 +19,170 @@ warnings.filterwarnings('ignore')
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
 
-# Fungsi format Rupiah
-def format_rupiah(x, pos):
-    if x >= 1e12:
-        return f'Rp{x/1e12:.1f}T'
-    elif x >= 1e9:
-        return f'Rp{x/1e9:.1f}M'
-    elif x >= 1e6:
-        return f'Rp{x/1e6:.1f}M'
-    else:
-        return f'Rp{x:,.0f}'
+# Profil render: draft untuk iterasi layout, screen untuk preview, print untuk laporan final
+RENDER_PROFILES = {
+    'draft': {'dpi': 72, 'format': 'png', 'tight_bbox': False},
+    'screen': {'dpi': 120, 'format': 'png', 'tight_bbox': True},
+    'print': {'dpi': 300, 'format': 'png', 'tight_bbox': True},
+}
+RENDER_FORMATS = ['png', 'svg', 'pdf']
+
+# Caption tiap grafik untuk laporan PDF
+GRAPH_CAPTIONS = {
+    'GRAFIK_1_PDRB_TREND': 'Grafik 1. Nilai PDRB DKI Jakarta per triwulan 2025 (ADHK 2010) beserta pertumbuhan YoY.',
+    'GRAFIK_2_KONSUMSI_RT': 'Grafik 2. Pengeluaran konsumsi rumah tangga per triwulan 2025 dan pertumbuhan YoY.',
+    'GRAFIK_3_PMTB_TREND': 'Grafik 3. Pembentukan Modal Tetap Bruto (PMTB) per triwulan 2025 dengan garis tren linear.',
+    'GRAFIK_4_YOY_COMPARISON': 'Grafik 4. Perbandingan laju pertumbuhan YoY komponen pengeluaran utama dan PDRB.',
+    'GRAFIK_5_KOMPOSISI_PDRB': 'Grafik 5. Komposisi konsumsi RT dan PMTB pada Triwulan III serta perbandingan antar triwulan.',
+    'GRAFIK_6_KONSUMSI_PEMERINTAH': 'Grafik 6. Pertumbuhan konsumsi pemerintah dan perbandingan nilai komponen Triwulan III.',
+}
+
+# Urutan triwulan untuk halaman lampiran data
+TRIWULAN_ORDER = {'Q1': 1, 'Q2': 2, 'Q3': 3, 'Q4': 4}
 
 # Buat folder plots jika belum ada
 os.makedirs('plots', exist_ok=True)
 
+def output_dir(profile):
+    """Folder output per profil; hasil print tetap di plots/"""
+    folder = 'plots' if profile == 'print' else os.path.join('plots', profile)
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+def save_graph(name, profile='print', fmt=None, pdf=None):
+    """Simpan figure aktif sesuai profil render, lalu tutup figure"""
+    settings = RENDER_PROFILES[profile]
+    
+    if pdf is not None:
+        # Mode laporan: halaman langsung ditulis ke PDF lalu dilepas dari memori
+        plt.figtext(0.5, -0.02, GRAPH_CAPTIONS.get(name, name),
+                    ha='center', va='top', fontsize=10, wrap=True)
+        pdf.savefig(dpi=settings['dpi'], bbox_inches='tight')
+        plt.close()
+        return f'{name} (halaman {pdf.get_pagecount()})'
+    
+    fmt = fmt or settings['format']
+    path = os.path.join(output_dir(profile), f'{name}.{fmt}')
+    
+    plt.savefig(path, format=fmt, dpi=settings['dpi'],
+                bbox_inches='tight' if settings['tight_bbox'] else None)
+    plt.close()
+    return path
+
+def save_contact_sheet(paths, profile='draft'):
+    """Gabungkan semua grafik PNG ke satu lembar kontak untuk cek cepat"""
+    images = [p for p in paths if p.endswith('.png')]
+    if not images:
+        return None
+    
+    ncols = 3
+    nrows = (len(images) + ncols - 1) // ncols
+    fig, axes = plt.subplots(nrows, ncols, figsize=(ncols * 6, nrows * 4))
+    
+    for ax in np.atleast_1d(axes).flat:
+        ax.axis('off')
+    for ax, path in zip(np.atleast_1d(axes).flat, images):
+        ax.imshow(plt.imread(path))
+        ax.set_title(os.path.basename(path), fontsize=10)
+    
+    plt.tight_layout()
+    path = os.path.join(output_dir(profile), 'CONTACT_SHEET.png')
+    plt.savefig(path, dpi=RENDER_PROFILES[profile]['dpi'])
+    plt.close()
+    return path
+
+def iter_detail_groups(df_yoy, df_nilai):
+    """Generator data lampiran, satu halaman per komponen"""
+    detail = df_nilai.merge(df_yoy, on=['Komponen', 'Triwulan'], how='left')
+    detail['Order'] = detail['Triwulan'].map(TRIWULAN_ORDER)
+    
+    for komponen, group in detail.groupby('Komponen', sort=False):
+        yield str(komponen), group.sort_values('Order')
+
+def write_detail_page(pdf, title, group, profile='print'):
+    """Tulis satu halaman lampiran: grafik kecil + tabel data, lalu tutup figure"""
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8.27, 11.69),
+                                   gridspec_kw={'height_ratios': [2, 1]})
+    
+    ax1.bar(group['Triwulan'], group['Nilai'], color='#1f77b4', alpha=0.8, width=0.6)
+    ax1.set_title(title.upper(), fontsize=14, fontweight='bold', pad=15)
+    ax1.set_ylabel('Nilai (Miliar Rupiah)', fontsize=11)
+    ax1.set_xlabel('Triwulan', fontsize=11)
+    ax1.yaxis.set_major_formatter(FuncFormatter(format_rupiah))
+    ax1.grid(True, alpha=0.3, axis='y')
+    
+    # Tabel data dari frame yang sama dengan grafik
+    cell_text = [
+        [triwulan, f'Rp{nilai/1000:.1f}T', '-' if pd.isna(growth) else f'{growth:.2f}%']
+        for triwulan, nilai, growth in zip(group['Triwulan'], group['Nilai'], group['Pertumbuhan'])
+    ]
+    ax2.axis('off')
+    table = ax2.table(cellText=cell_text, colLabels=['Triwulan', 'Nilai', 'Pertumbuhan YoY'],
+                      loc='upper center', cellLoc='center')
+    table.scale(1, 1.6)
+    
+    fig.text(0.5, 0.02, f'Tabel data {title}. Sumber: BPS Provinsi DKI Jakarta 2025',
+             ha='center', fontsize=9, style='italic')
+    pdf.savefig(fig, dpi=RENDER_PROFILES[profile]['dpi'])
+    plt.close(fig)
+
+def write_data_appendix(pdf, df_yoy, df_nilai, profile='print'):
+    """Tambahkan lampiran data ke PDF secara streaming, halaman demi halaman"""
+    pages = 0
+    for title, group in iter_detail_groups(df_yoy, df_nilai):
+        write_detail_page(pdf, title, group, profile)
+        pages += 1
+    return pages
+
 def load_clean_data():
     """Load hanya data yang sudah clean (3 triwulan)"""
     print("📂 Loading clean data...")
     
     try:
+        paths = ['data/PDRB_Jakarta_YoY.xlsx', 'data/PDRB_Jakarta_Nilai.xlsx']
+        df_yoy = pd.read_excel(paths[0])
+        df_nilai = pd.read_excel(paths[1])
+        
+        # Validasi data sebelum kolom di-rename dan grafik dibuat (cache per isi file)
+        require_valid(validation_report({
+            'yoy': lambda: validate_long(df_yoy, 'Pertumbuhan', required=KOMPONEN_RINGKAS),
+            'nilai': lambda: validate_long(df_nilai, 'Nilai', required=KOMPONEN_RINGKAS),
+        }, file_version(paths)))
+        
         # Data YoY Growth
-        df_yoy = pd.read_excel('data/PDRB_Jakarta_YoY.xlsx')
         df_yoy.columns = ['Komponen', 'Triwulan', 'Pertumbuhan']
+        df_yoy['Pertumbuhan'] = pd.to_numeric(df_yoy['Pertumbuhan'])
         print(f"  ✅ YoY Data: {len(df_yoy)} rows, {df_yoy['Komponen'].unique()}")
         
         # Data Nilai
-        df_nilai = pd.read_excel('data/PDRB_Jakarta_Nilai.xlsx')
         df_nilai.columns = ['Komponen', 'Triwulan', 'Nilai']
+        df_nilai['Nilai'] = pd.to_numeric(df_nilai['Nilai'])
         print(f"  ✅ Nilai Data: {len(df_nilai)} rows")
         
-        # Validasi data
         print(f"  📊 Triwulan tersedia: {df_nilai['Triwulan'].unique()}")
         print(f"  📊 Komponen tersedia: {df_nilai['Komponen'].unique()}")
         
         return df_yoy, df_nilai
         
-    except Exception as e:
+    except DataValidationError as e:
+        print("❌ Data ditolak oleh validasi:")
+        for name, source in e.report['sources'].items():
+            for error in source['errors']:
+                print(f"    ❌ {name}: {error}")
+        return None, None
+        
+    except OSError as e:
         print(f"❌ Error loading data: {e}")
         return None, None
 
-def create_6_complete_graphs():
+def create_6_complete_graphs(profile='print', fmt=None, pdf_path=None):
     """Buat 6 grafik lengkap untuk laporan"""
     print("\n" + "="*60)
-    print("🎨 MEMBUAT 6 GRAFIK LENGKAP UNTUK LAPORAN")
+    print(f"🎨 MEMBUAT 6 GRAFIK LENGKAP UNTUK LAPORAN (profil: {profile})")
     print("="*60)
     
+    start = time.perf_counter()
+    
     # Load data
     df_yoy, df_nilai = load_clean_data()
     
@@ -64,6 +190,48 @@ def create_6_complete_graphs():
         print("❌ Tidak dapat melanjutkan, data tidak valid")
         return
     
+    # Data chart bersama dashboard (filter, urutan, join pertumbuhan)
+    charts = resolve_charts(df_nilai, df_yoy)
+    
+    if pdf_path:
+        # Laporan PDF ditulis bertahap: tiap halaman di-flush ke file saat disimpan;
+        # file selalu ditutup dengan benar walaupun ada grafik yang gagal
+        os.makedirs(os.path.dirname(pdf_path) or '.', exist_ok=True)
+        with PdfPages(pdf_path, metadata={'Title': 'Laporan PDRB DKI Jakarta 2025',
+                                          'Subject': 'Sumber: BPS Provinsi DKI Jakarta'}) as pdf:
+            saved = draw_graphs(charts, df_yoy, df_nilai, profile, fmt, pdf)
+            
+            print("\n7. 📑 LAMPIRAN DATA")
+            pages = write_data_appendix(pdf, df_yoy, df_nilai, profile)
+            print(f"  ✅ {pages} halaman lampiran data ditambahkan")
+        saved.append(pdf_path)
+    else:
+        saved = draw_graphs(charts, df_yoy, df_nilai, profile, fmt)
+        if profile == 'draft':
+            sheet = save_contact_sheet(saved, profile)
+            if sheet:
+                saved.append(sheet)
+            else:
+                print("  ⚠️ Contact sheet tidak dibuat: draft hanya menggabungkan grafik PNG")
+    
+    print("\n" + "="*60)
+    print(f"🎉 SELESAI! {len(saved)} OUTPUT TELAH DIBUAT ({time.perf_counter() - start:.1f} detik):")
+    print("="*60)
+    for path in saved:
+        print(f"  - {path}")
+    if pdf_path:
+        print(f"\n✅ Laporan PDF tersimpan di '{pdf_path}'")
+    else:
+        print(f"\n✅ Semua grafik tersimpan di folder '{output_dir(profile)}/'")
+    if profile == 'print':
+        print("✅ Siap untuk dimasukkan ke dalam laporan!")
+    
+    return saved
+
+def draw_graphs(charts, df_yoy, df_nilai, profile='print', fmt=None, pdf=None):
+    """Gambar Grafik 1-6; tiap grafik ke file sendiri atau ke halaman PDF"""
+    saved = []
+    
     # ===============================
     # GRAFIK 1: TREN PDRB 2025
     # ===============================
@@ -71,13 +239,8 @@ def create_6_complete_graphs():
     try:
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        # Filter data PDRB
-        pdrb_data = df_nilai[df_nilai['Komponen'] == 'PDRB'].copy()
-        
-        # Urutkan triwulan
-        triwulan_order = {'Q1': 1, 'Q2': 2, 'Q3': 3}
-        pdrb_data['Order'] = pdrb_data['Triwulan'].map(triwulan_order)
-        pdrb_data = pdrb_data.sort_values('Order')
+        # Data PDRB (sudah urut per triwulan)
+        pdrb_data = charts['pdrb_trend']
         
         # Bar chart dengan warna berbeda
         colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
@@ -85,17 +248,13 @@ def create_6_complete_graphs():
                      color=colors, alpha=0.8, width=0.6)
         
         # Tambahkan nilai di atas bar
-        for i, (bar, row) in enumerate(zip(bars, pdrb_data.iterrows())):
-            nilai = row[1]['Nilai']
+        for bar, nilai, growth in zip(bars, pdrb_data['Nilai'], pdrb_data['Pertumbuhan']):
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height + 5000,
                    f'Rp{nilai/1000:.1f}T', ha='center', va='bottom', fontsize=10)
             
             # Tambahkan pertumbuhan YoY jika ada
-            growth_data = df_yoy[(df_yoy['Komponen'] == 'PDRB') & 
-                                (df_yoy['Triwulan'] == row[1]['Triwulan'])]
-            if not growth_data.empty:
-                growth = growth_data.iloc[0]['Pertumbuhan']
+            if not pd.isna(growth):
                 ax.text(bar.get_x() + bar.get_width()/2., height/2,
                        f'{growth}%', ha='center', va='center', 
                        fontsize=11, fontweight='bold', color='white')
@@ -105,7 +264,7 @@ def create_6_complete_graphs():
         ax.set_ylabel('Nilai (Miliar Rupiah)', fontsize=12)
         ax.set_xlabel('Triwulan', fontsize=12)
         ax.set_xticks(range(len(pdrb_data)))
-        ax.set_xticklabels(['Triwulan I', 'Triwulan II', 'Triwulan III'])
+        ax.set_xticklabels(pdrb_data['Triwulan'])
         ax.yaxis.set_major_formatter(FuncFormatter(format_rupiah))
         ax.grid(True, alpha=0.3, axis='y')
         
@@ -114,12 +273,14 @@ def create_6_complete_graphs():
                    ha='center', fontsize=9, style='italic')
         
         plt.tight_layout()
-        plt.savefig('plots/GRAFIK_1_PDRB_TREND.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        saved.append(save_graph('GRAFIK_1_PDRB_TREND', profile, fmt, pdf))
         print("  ✅ Grafik 1: Tren PDRB berhasil dibuat")
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
+    except Exception:
+        # Data sudah tervalidasi, jadi error di sini adalah bug: tutup figure lalu gagal
+        plt.close('all')
+        print("  ❌ Grafik 1 gagal dibuat")
+        raise
     
     # ===============================
     # GRAFIK 2: KONSUMSI RUMAH TANGGA
@@ -128,10 +289,8 @@ def create_6_complete_graphs():
     try:
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        # Filter data Konsumsi RT
-        konsumsi_data = df_nilai[df_nilai['Komponen'] == 'Konsumsi RT'].copy()
-        konsumsi_data['Order'] = konsumsi_data['Triwulan'].map(triwulan_order)
-        konsumsi_data = konsumsi_data.sort_values('Order')
+        # Data Konsumsi RT (sudah urut per triwulan)
+        konsumsi_data = charts['konsumsi_rt']
         
         # Line chart dengan area
         ax.plot(konsumsi_data['Triwulan'], konsumsi_data['Nilai'], 
@@ -143,17 +302,16 @@ def create_6_complete_graphs():
                        alpha=0.2, color='#2ca02c')
         
         # Anotasi nilai
-        for _, row in konsumsi_data.iterrows():
-            ax.text(row['Triwulan'], row['Nilai'] + 1000, 
-                   f'Rp{row["Nilai"]/1000:.1f}T', 
+        for triwulan, nilai, growth in zip(konsumsi_data['Triwulan'], konsumsi_data['Nilai'],
+                                           konsumsi_data['Pertumbuhan']):
+            ax.text(triwulan, nilai + 1000, 
+                   f'Rp{nilai/1000:.1f}T', 
                    ha='center', va='bottom', fontsize=10, fontweight='bold')
             
             # Tambahkan pertumbuhan
-            growth = df_yoy[(df_yoy['Komponen'] == 'Konsumsi RT') & 
-                           (df_yoy['Triwulan'] == row['Triwulan'])]
-            if not growth.empty:
-                ax.text(row['Triwulan'], row['Nilai'] * 0.9, 
-                       f'{growth.iloc[0]["Pertumbuhan"]}% YoY', 
+            if not pd.isna(growth):
+                ax.text(triwulan, nilai * 0.9, 
+                       f'{growth}% YoY', 
                        ha='center', va='top', fontsize=9, style='italic')
         
         ax.set_title('PERTUMBUHAN KONSUMSI RUMAH TANGGA DKI JAKARTA 2025', 
@@ -167,12 +325,13 @@ def create_6_complete_graphs():
                    ha='center', fontsize=9, style='italic')
         
         plt.tight_layout()
-        plt.savefig('plots/GRAFIK_2_KONSUMSI_RT.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        saved.append(save_graph('GRAFIK_2_KONSUMSI_RT', profile, fmt, pdf))
         print("  ✅ Grafik 2: Konsumsi RT berhasil dibuat")
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
+    except Exception:
+        plt.close('all')
+        print("  ❌ Grafik 2 gagal dibuat")
+        raise
     
     # ===============================
     # GRAFIK 3: PMTB (INVESTASI)
@@ -181,10 +340,8 @@ def create_6_complete_graphs():
     try:
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        # Filter data PMTB
-        pmtb_data = df_nilai[df_nilai['Komponen'] == 'PMTB'].copy()
-        pmtb_data['Order'] = pmtb_data['Triwulan'].map(triwulan_order)
-        pmtb_data = pmtb_data.sort_values('Order')
+        # Data PMTB (sudah urut per triwulan)
+        pmtb_data = charts['pmtb']
         
         # Bar chart dengan gradient warna
         colors = ['#d62728', '#9467bd', '#8c564b']
@@ -192,17 +349,13 @@ def create_6_complete_graphs():
                      color=colors, alpha=0.8, width=0.6)
         
         # Anotasi
-        for i, (bar, row) in enumerate(zip(bars, pmtb_data.iterrows())):
-            nilai = row[1]['Nilai']
+        for bar, nilai, growth_val in zip(bars, pmtb_data['Nilai'], pmtb_data['Pertumbuhan']):
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height + 5000,
                    f'Rp{nilai/1000:.1f}T', ha='center', va='bottom', fontsize=10)
             
             # Growth annotation
-            growth = df_yoy[(df_yoy['Komponen'] == 'PMTB') & 
-                           (df_yoy['Triwulan'] == row[1]['Triwulan'])]
-            if not growth.empty:
-                growth_val = growth.iloc[0]['Pertumbuhan']
+            if not pd.isna(growth_val):
                 color = 'green' if growth_val > 0 else 'red'
                 ax.text(bar.get_x() + bar.get_width()/2., height/2,
                        f'↑ {growth_val}%' if growth_val > 0 else f'↓ {abs(growth_val)}%',
@@ -214,7 +367,7 @@ def create_6_complete_graphs():
         ax.set_ylabel('Nilai (Miliar Rupiah)', fontsize=12)
         ax.set_xlabel('Triwulan', fontsize=12)
         ax.set_xticks(range(len(pmtb_data)))
-        ax.set_xticklabels(['Triwulan I', 'Triwulan II', 'Triwulan III'])
+        ax.set_xticklabels(pmtb_data['Triwulan'])
         ax.yaxis.set_major_formatter(FuncFormatter(format_rupiah))
         ax.grid(True, alpha=0.3, axis='y')
         
@@ -231,12 +384,13 @@ def create_6_complete_graphs():
                    ha='center', fontsize=9, style='italic')
         
         plt.tight_layout()
-        plt.savefig('plots/GRAFIK_3_PMTB_TREND.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        saved.append(save_graph('GRAFIK_3_PMTB_TREND', profile, fmt, pdf))
         print("  ✅ Grafik 3: PMTB berhasil dibuat")
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
+    except Exception:
+        plt.close('all')
+        print("  ❌ Grafik 3 gagal dibuat")
+        raise
     
     # ===============================
     # GRAFIK 4: PERBANDINGAN YOY
@@ -293,12 +447,13 @@ def create_6_complete_graphs():
                    ha='center', fontsize=9, style='italic')
         
         plt.tight_layout()
-        plt.savefig('plots/GRAFIK_4_YOY_COMPARISON.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        saved.append(save_graph('GRAFIK_4_YOY_COMPARISON', profile, fmt, pdf))
         print("  ✅ Grafik 4: Perbandingan YoY berhasil dibuat")
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
+    except Exception:
+        plt.close('all')
+        print("  ❌ Grafik 4 gagal dibuat")
+        raise
     
     # ===============================
     # GRAFIK 5: KOMPOSISI PDRB
@@ -346,6 +501,7 @@ def create_6_complete_graphs():
             
             if len(bar_data) > 0:
                 # Urutkan
+                triwulan_order = {'Q1': 1, 'Q2': 2, 'Q3': 3}
                 bar_data['Order'] = bar_data['Triwulan'].map(triwulan_order)
                 bar_data = bar_data.sort_values(['Komponen', 'Order'])
                 
@@ -386,12 +542,13 @@ def create_6_complete_graphs():
                    ha='center', fontsize=9, style='italic')
         
         plt.tight_layout()
-        plt.savefig('plots/GRAFIK_5_KOMPOSISI_PDRB.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        saved.append(save_graph('GRAFIK_5_KOMPOSISI_PDRB', profile, fmt, pdf))
         print("  ✅ Grafik 5: Komposisi PDRB berhasil dibuat")
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
+    except Exception:
+        plt.close('all')
+        print("  ❌ Grafik 5 gagal dibuat")
+        raise
     
     # ===============================
     # GRAFIK 6: KONSUMSI PEMERINTAH
@@ -455,26 +612,30 @@ def create_6_complete_graphs():
         plt.suptitle('ANALISIS KONSUMSI PEMERINTAH DKI JAKARTA', 
                     fontsize=16, fontweight='bold', y=1.02)
         plt.tight_layout()
-        plt.savefig('plots/GRAFIK_6_KONSUMSI_PEMERINTAH.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        saved.append(save_graph('GRAFIK_6_KONSUMSI_PEMERINTAH', profile, fmt, pdf))
         print("  ✅ Grafik 6: Konsumsi Pemerintah berhasil dibuat")
         
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
+    except Exception:
+        plt.close('all')
+        print("  ❌ Grafik 6 gagal dibuat")
+        raise
     
-    print("\n" + "="*60)
-    print("🎉 SELESAI! 6 GRAFIK TELAH DIBUAT:")
-    print("="*60)
-    print("1. 📈 GRAFIK_1_PDRB_TREND.png")
-    print("2. 🏠 GRAFIK_2_KONSUMSI_RT.png")
-    print("3. 🏗️ GRAFIK_3_PMTB_TREND.png")
-    print("4. 📊 GRAFIK_4_YOY_COMPARISON.png")
-    print("5. 🥧 GRAFIK_5_KOMPOSISI_PDRB.png")
-    print("6. 🏛️ GRAFIK_6_KONSUMSI_PEMERINTAH.png")
-    print("\n✅ Semua grafik tersimpan di folder 'plots/'")
-    print("✅ Siap untuk dimasukkan ke dalam laporan!")
+    return saved
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate 6 grafik laporan PDRB")
+    parser.add_argument('--profile', choices=list(RENDER_PROFILES), default='print',
+                        help="draft (cepat + contact sheet), screen, atau print (300 dpi)")
+    parser.add_argument('--format', choices=RENDER_FORMATS, default=None,
+                        help="Override format output profil (png, svg, pdf)")
+    parser.add_argument('--pdf', metavar='PATH', default=None,
+                        help="Tulis semua grafik + lampiran data ke satu PDF multi-halaman")
+    args = parser.parse_args()
+    if args.pdf and args.format:
+        parser.error("--format tidak berlaku bersama --pdf (semua halaman ditulis ke PDF)")
+    if args.profile == 'draft' and args.format not in (None, 'png'):
+        parser.error("profil draft hanya mendukung --format png (contact sheet dibuat dari PNG)")
+    
     print("🚀 MEMULAI GENERASI 6 GRAFIK LENGKAP")
     print("="*60)
-    create_6_complete_graphs()
\ No newline at end of file
+    create_6_complete_graphs(args.profile, args.format, args.pdf)
\ No newline at end of file
@@ -0,0 +1,393 @@
+# dashboard/snapshot.py
+"""Build snapshot statis dashboard (HTML mandiri, tanpa sesi Python per viewer).
+
+Pipeline dashboard dijalankan sekali per versi data; hasilnya disimpan di
+snapshot/<versi>/index.html dan disalin ke snapshot/index.html sehingga
+folder snapshot/ bisa langsung disajikan oleh static file server apa pun.
+
+    python snapshot.py --data-dir ../data --output snapshot
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+from data_loader import DATA_DIR, KOMPONEN_OPTIONS, data_version, read_pdrb_data
+from chart_specs import resolve_charts
+from formatting import format_rupiah_series
+from figures import (
+    CHART_TYPES,
+    kpi_metrics,
+    pdrb_trend_figure,
+    component_comparison_figure,
+    household_consumption_figure,
+    government_consumption_figure,
+    consumption_growth_figure,
+    pmtb_area_figure,
+    pmtb_growth_gauge,
+    investment_vs_consumption_figure,
+    correlation_matrix,
+    correlation_figure,
+)
+
+SNAPSHOT_DIR = 'snapshot'
+
+# Modul yang ikut menentukan isi snapshot (figure, spec chart, format tabel, template ini)
+CODE_FILES = ['figures.py', 'chart_specs.py', 'formatting.py', 'snapshot.py']
+
+# Figure yang trace-nya per komponen dan ikut filter "Pilih Komponen"
+# (sama dengan filter sidebar di app.py)
+FILTERABLE_FIGURES = ['fig2', 'fig5', 'fig8']
+
+
+def snapshot_version(data_dir=DATA_DIR):
+    """Versi data + hash kode render, supaya perubahan figure/template ikut memicu build"""
+    digest = hashlib.sha1()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in CODE_FILES:
+        with open(os.path.join(here, name), 'rb') as f:
+            digest.update(f.read())
+    return f'{data_version(data_dir)}-{digest.hexdigest()[:8]}'
+
+
+def build_figures(df_laju, df_pdrb_full, charts):
+    """Render semua figure dashboard sekali, sebagai dict JSON Plotly"""
+    comparison_data = df_pdrb_full[df_pdrb_full['Komponen'].isin([
+        'Pengeluaran Konsumsi Rumah Tangga',
+        'Pembentukan Modal Tetap Bruto',
+        'Pengeluaran Konsumsi Pemerintah'
+    ])]
+    konsumsi_gov_data = df_pdrb_full[df_pdrb_full['Komponen'] == 'Pengeluaran Konsumsi Pemerintah']
+    growth_comparison = df_laju[df_laju['Komponen'].isin([
+        'Pengeluaran Konsumsi Rumah Tangga',
+        'Pengeluaran Konsumsi Pemerintah'
+    ])]
+    pmtb_growth = df_laju[df_laju['Komponen'] == 'Pembentukan Modal Tetap Bruto']
+    comparison_df = df_pdrb_full[df_pdrb_full['Komponen'].isin([
+        'Pembentukan Modal Tetap Bruto',
+        'Pengeluaran Konsumsi Rumah Tangga'
+    ])]
+    corr_data = df_pdrb_full[df_pdrb_full['Komponen'].isin(KOMPONEN_OPTIONS)]
+
+    figures = {
+        'fig2': component_comparison_figure(comparison_data),
+        'fig3': household_consumption_figure(charts['konsumsi_rt']),
+        'fig4': government_consumption_figure(konsumsi_gov_data),
+        'fig5': consumption_growth_figure(growth_comparison),
+        'fig6': pmtb_area_figure(charts['pmtb']),
+        'fig7': pmtb_growth_gauge(pmtb_growth),
+        'fig8': investment_vs_consumption_figure(comparison_df),
+        'fig9': correlation_figure(correlation_matrix(corr_data)),
+    }
+    # Chart 1 bergantung pada "Tipe Chart", jadi semua varian di-render
+    for chart_type in CHART_TYPES:
+        figures[f'fig1|{chart_type}'] = pdrb_trend_figure(charts['pdrb_trend'], chart_type)
+
+    return {name: json.loads(pio.to_json(fig, validate=False))
+            for name, fig in figures.items()}
+
+
+def compact_frame(df, value_col):
+    """Encode data long-format sebagai kamus komponen/triwulan + baris integer"""
+    komponen = list(dict.fromkeys(df['Komponen']))
+    triwulan = list(dict.fromkeys(df['Triwulan']))
+    k_index = {k: i for i, k in enumerate(komponen)}
+    t_index = {t: i for i, t in enumerate(triwulan)}
+    rows = [[k_index[k], t_index[t], float(v)]
+            for k, t, v in zip(df['Komponen'], df['Triwulan'], df[value_col])]
+    return {'komponen': komponen, 'triwulan': triwulan, 'value': value_col, 'rows': rows}
+
+
+def data_points(pdrb_trend):
+    """Tabel Data Points seperti di app: PDRB per triwulan (chart spec), nilai sudah diformat"""
+    return [[t, v] for t, v in zip(pdrb_trend['Triwulan'], format_rupiah_series(pdrb_trend['Nilai']))]
+
+
+def render_html(version, kpis, figures, data, points):
+    """Gabungkan plotly.js, figure, data dan script filter ke satu file HTML"""
+    payload = {
+        'version': version,
+        'kpis': kpis,
+        'figures': figures,
+        'data': data,
+        'data_points': points,
+        'komponen': KOMPONEN_OPTIONS,
+        'chart_types': CHART_TYPES,
+        'filterable': FILTERABLE_FIGURES,
+    }
+    # "</" di dalam JSON bisa menutup tag <script> lebih awal
+    payload_json = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    payload_json = payload_json.replace('</', '<\\/')
+
+    return (HTML_TEMPLATE
+            .replace('__VERSION__', version)
+            .replace('__PLOTLYJS__', get_plotlyjs())
+            .replace('__PAYLOAD__', payload_json))
+
+
+def build_snapshot(data_dir=DATA_DIR, output_dir=SNAPSHOT_DIR, force=False):
+    """Build snapshot untuk versi data saat ini, lewati jika sudah ada"""
+    version = snapshot_version(data_dir)
+    version_dir = os.path.join(output_dir, version)
+    index_path = os.path.join(version_dir, 'index.html')
+
+    if os.path.exists(index_path) and not force:
+        print(f"✅ Snapshot versi {version} sudah ada: {index_path}")
+    else:
+        print(f"📂 Membuat snapshot versi {version}...")
+        df_yoy, df_nilai, df_laju, df_pdrb_full = read_pdrb_data(data_dir)
+        charts = resolve_charts(df_pdrb_full, df_laju)
+
+        html = render_html(
+            version,
+            kpi_metrics(df_pdrb_full, df_laju),
+            build_figures(df_laju, df_pdrb_full, charts),
+            {
+                'pdrb': compact_frame(df_pdrb_full, 'Nilai'),
+                'laju': compact_frame(df_laju, 'Pertumbuhan'),
+            },
+            data_points(charts['pdrb_trend']),
+        )
+        os.makedirs(version_dir, exist_ok=True)
+        with open(index_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"✅ Snapshot tersimpan: {index_path}")
+
+    shutil.copyfile(index_path, os.path.join(output_dir, 'index.html'))
+    return index_path
+
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta name="data-version" content="__VERSION__">
+<title>Gentrifikasi DKI Jakarta - Dashboard Ekonomi</title>
+<style>
+    body { margin: 0; font-family: sans-serif; color: #111827; display: flex; }
+    aside { width: 260px; min-height: 100vh; background: #F0F2F6; padding: 1.5rem; box-sizing: border-box; }
+    aside h4 { margin: 1.2rem 0 0.4rem; }
+    aside label { display: block; margin: 0.2rem 0; font-size: 0.9rem; }
+    main { flex: 1; padding: 1.5rem 2rem; min-width: 0; }
+    .main-header { font-size: 2.5rem; color: #1E3A8A; text-align: center; margin-bottom: 1rem; }
+    .sub-header { font-size: 1.2rem; color: #4B5563; text-align: center; margin-bottom: 2rem; }
+    .tabs { display: flex; gap: 10px; border-bottom: 1px solid #E5E7EB; }
+    .tabs button { background: #F3F4F6; border: 0; border-radius: 4px 4px 0 0; padding: 10px 20px; cursor: pointer; }
+    .tabs button.active { background: #1E3A8A; color: white; }
+    .tab { display: none; }
+    .tab.active { display: block; }
+    .kpis { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; }
+    .kpi .label { font-size: 0.9rem; color: #4B5563; }
+    .kpi .value { font-size: 2rem; }
+    .kpi .delta { color: #16A34A; font-size: 0.9rem; }
+    .row { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }
+    .row.wide { grid-template-columns: 3fr 1fr; }
+    table { border-collapse: collapse; width: 100%; }
+    td, th { border-bottom: 1px solid #E5E7EB; padding: 4px 8px; text-align: right; }
+    td:first-child, th:first-child { text-align: left; }
+    .caption { color: #6B7280; font-size: 0.8rem; }
+</style>
+</head>
+<body>
+<aside>
+    <h3>Filter Dashboard</h3>
+    <h4>Tahun Analisis</h4>
+    <select disabled><option>2025</option></select>
+    <h4>Komponen Ekonomi</h4>
+    <div id="komponen-filter"></div>
+    <h4>Jenis Visualisasi</h4>
+    <select id="chart-type"></select>
+    <h4>Metrik Tambahan</h4>
+    <label><input type="checkbox" id="show-metrics" checked> Tampilkan Metrik KPI</label>
+    <hr>
+    <p class="caption">Sumber Data: BPS Provinsi DKI Jakarta 2025<br>Versi data: __VERSION__</p>
+</aside>
+<main>
+    <h1 class="main-header">🏙️ DASHBOARD ANALISIS GENTRIFIKASI DKI JAKARTA</h1>
+    <p class="sub-header">Visualisasi Interaktif PDRB dan Indikator Ekonomi Makro 2025</p>
+    <div class="tabs">
+        <button data-tab="tab1" class="active">📊 Overview</button>
+        <button data-tab="tab2">💰 Konsumsi</button>
+        <button data-tab="tab3">🏗️ Investasi</button>
+        <button data-tab="tab4">📈 Analisis</button>
+        <button data-tab="tab5">📥 Ekspor</button>
+    </div>
+    <section id="tab1" class="tab active">
+        <h2>Overview Ekonomi DKI Jakarta 2025</h2>
+        <div class="kpis" id="kpis"></div>
+        <h3>Tren PDRB Triwulanan 2025</h3>
+        <div class="row wide">
+            <div id="fig1"></div>
+            <div><h3>Data Points</h3><table id="data-points"></table></div>
+        </div>
+        <h3>Perbandingan Komponen Utama</h3>
+        <div id="fig2"></div>
+    </section>
+    <section id="tab2" class="tab">
+        <h2>Analisis Konsumsi</h2>
+        <div class="row"><div id="fig3"></div><div id="fig4"></div></div>
+        <h3>Analisis Pertumbuhan Konsumsi</h3>
+        <div id="fig5"></div>
+    </section>
+    <section id="tab3" class="tab">
+        <h2>Analisis Investasi (PMTB)</h2>
+        <div class="row"><div id="fig6"></div><div id="fig7"></div></div>
+        <h3>Komparasi Investasi vs Konsumsi</h3>
+        <div id="fig8"></div>
+    </section>
+    <section id="tab4" class="tab">
+        <h2>Analisis Lanjutan</h2>
+        <h3>Analisis Korelasi</h3>
+        <div id="fig9"></div>
+    </section>
+    <section id="tab5" class="tab">
+        <h2>Ekspor Data</h2>
+        <p><button id="download-pdrb">Unduh PDRB (CSV)</button>
+           <button id="download-laju">Unduh Pertumbuhan (CSV)</button></p>
+    </section>
+</main>
+<script>__PLOTLYJS__</script>
+<script id="payload" type="application/json">__PAYLOAD__</script>
+<script>
+(function () {
+    var P = JSON.parse(document.getElementById('payload').textContent);
+    var config = {responsive: true, displaylogo: false};
+    var rendered = {};
+
+    function selectedKomponen() {
+        return Array.prototype.map.call(
+            document.querySelectorAll('#komponen-filter input:checked'),
+            function (el) { return el.value; });
+    }
+
+    function figureFor(id) {
+        if (id === 'fig1') {
+            return P.figures['fig1|' + document.getElementById('chart-type').value];
+        }
+        return P.figures[id];
+    }
+
+    function draw(id) {
+        var el = document.getElementById(id);
+        var fig = figureFor(id);
+        var data = fig.data;
+        if (P.filterable.indexOf(id) !== -1) {
+            var keep = selectedKomponen();
+            data = data.map(function (trace) {
+                return Object.assign({}, trace, {visible: keep.indexOf(trace.name) !== -1});
+            });
+        }
+        Plotly.react(el, data, fig.layout, config);
+        rendered[id] = true;
+    }
+
+    function drawTab(tab) {
+        tab.querySelectorAll('div[id^="fig"]').forEach(function (el) { draw(el.id); });
+    }
+
+    function redrawVisible(ids) {
+        ids.forEach(function (id) {
+            if (rendered[id]) { draw(id); }
+        });
+    }
+
+    function rows(name) {
+        var d = P.data[name];
+        return d.rows.map(function (r) {
+            return {Komponen: d.komponen[r[0]], Triwulan: d.triwulan[r[1]], value: r[2]};
+        });
+    }
+
+    function download(name) {
+        var label = P.data[name].value;
+        var lines = ['Komponen,Triwulan,' + label];
+        rows(name).forEach(function (r) {
+            lines.push('"' + r.Komponen + '","' + r.Triwulan + '",' + r.value);
+        });
+        var blob = new Blob([lines.join('\\n')], {type: 'text/csv'});
+        var a = document.createElement('a');
+        a.href = URL.createObjectURL(blob);
+        a.download = name + '_' + P.version + '.csv';
+        a.click();
+    }
+
+    // Sidebar
+    var filter = document.getElementById('komponen-filter');
+    P.komponen.forEach(function (k) {
+        var label = document.createElement('label');
+        label.innerHTML = '<input type="checkbox" checked> ';
+        label.firstChild.value = k;
+        label.appendChild(document.createTextNode(k));
+        filter.appendChild(label);
+    });
+    filter.addEventListener('change', function () { redrawVisible(P.filterable); });
+
+    var chartType = document.getElementById('chart-type');
+    P.chart_types.forEach(function (t) {
+        var opt = document.createElement('option');
+        opt.textContent = t;
+        chartType.appendChild(opt);
+    });
+    chartType.addEventListener('change', function () { draw('fig1'); });
+
+    var kpis = document.getElementById('kpis');
+    P.kpis.forEach(function (m) {
+        var div = document.createElement('div');
+        div.className = 'kpi';
+        ['label', 'value', 'delta'].forEach(function (key) {
+            var span = document.createElement('div');
+            span.className = key;
+            span.textContent = m[key];
+            div.appendChild(span);
+        });
+        kpis.appendChild(div);
+    });
+    document.getElementById('show-metrics').addEventListener('change', function (e) {
+        kpis.style.display = e.target.checked ? '' : 'none';
+    });
+
+    // Data Points (PDRB per triwulan, sama dengan tabel di app)
+    var table = document.getElementById('data-points');
+    table.innerHTML = '<tr><th>Triwulan</th><th>Nilai</th></tr>';
+    P.data_points.forEach(function (r) {
+        var tr = table.insertRow();
+        tr.insertCell().textContent = r[0];
+        tr.insertCell().textContent = r[1];
+    });
+
+    document.getElementById('download-pdrb').addEventListener('click', function () { download('pdrb'); });
+    document.getElementById('download-laju').addEventListener('click', function () { download('laju'); });
+
+    // Tabs: figure di-render saat tab pertama kali dibuka
+    document.querySelectorAll('.tabs button').forEach(function (btn) {
+        btn.addEventListener('click', function () {
+            document.querySelectorAll('.tabs button, .tab').forEach(function (el) {
+                el.classList.remove('active');
+            });
+            btn.classList.add('active');
+            var tab = document.getElementById(btn.dataset.tab);
+            tab.classList.add('active');
+            drawTab(tab);
+        });
+    });
+    drawTab(document.getElementById('tab1'));
+})();
+</script>
+</body>
+</html>
+"""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build snapshot statis dashboard PDRB")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="Folder file Excel BPS")
+    parser.add_argument('--output', default=SNAPSHOT_DIR, help="Folder output snapshot")
+    parser.add_argument('--force', action='store_true', help="Build ulang meski versi sudah ada")
+    args = parser.parse_args()
+
+    build_snapshot(args.data_dir, args.output, args.force)
@@ -0,0 +1,242 @@
+# dashboard/validation.py
+"""Validasi kualitas data rilis BPS sebelum masuk ke dashboard/laporan.
+
+Semua pemeriksaan dijalankan vektor per frame (tanpa loop per baris) dan
+hasilnya dikumpulkan dalam satu report dict per versi data:
+
+    {'version': ..., 'valid': bool, 'sources': {nama: {'errors', 'warnings', 'checks'}}}
+
+    python validation.py --data-dir ../data
+"""
+import argparse
+import json
+
+import numpy as np
+import pandas as pd
+
+QUARTERS = ['Triwulan I', 'Triwulan II', 'Triwulan III', 'Triwulan IV']
+QUARTER_CODES = ['Q1', 'Q2', 'Q3', 'Q4']
+
+# Identitas PDRB menurut pengeluaran: jumlah komponen (impor dikurangkan) = PDRB
+IDENTITY_SIGNS = {
+    'Pengeluaran Konsumsi Rumah Tangga': 1,
+    'Pengeluaran Konsumsi LNPRT': 1,
+    'Pengeluaran Konsumsi Pemerintah': 1,
+    'Pembentukan Modal Tetap Bruto': 1,
+    'Perubahan Inventori': 1,
+    'Ekspor Luar Negeri': 1,
+    'Impor Luar Negeri': -1,
+    'Net Ekspor Antar Daerah': 1,
+}
+IDENTITY_TOLERANCE = 0.005  # selisih relatif maksimum (pembulatan/diskrepansi statistik)
+
+# Report yang sudah dihitung, per (versi data, nama sumber)
+_REPORTS = {}
+
+
+class DataValidationError(ValueError):
+    """Rilis data ditolak; atribut report berisi detail pemeriksaan"""
+
+    def __init__(self, report):
+        self.report = report
+        errors = [f'{name}: {e}' for name, src in report['sources'].items() for e in src['errors']]
+        super().__init__('; '.join(errors))
+
+
+def _new_source():
+    return {'errors': [], 'warnings': [], 'checks': {}}
+
+
+def _record(source, check, problems, level='errors'):
+    """Catat hasil satu pemeriksaan (ok / fail / warn)"""
+    if not problems:
+        source['checks'][check] = 'ok'
+    else:
+        source['checks'][check] = 'fail' if level == 'errors' else 'warn'
+        source[level].extend(problems)
+
+
+def _sample(values, n=5):
+    values = list(values)
+    more = f' (+{len(values) - n} lainnya)' if len(values) > n else ''
+    return ', '.join(str(v) for v in values[:n]) + more
+
+
+def data_rows(raw):
+    """Mask baris data di sheet BPS lebar: Komponen terisi + minimal satu nilai numerik"""
+    numeric = raw.iloc[:, 1:].apply(pd.to_numeric, errors='coerce')
+    return (raw.iloc[:, 0].notna() & numeric.notna().any(axis=1)).to_numpy()
+
+
+def wide_table(raw, columns):
+    """Tabel Komponen x triwulan dari sheet BPS lebar, tanpa baris judul/catatan"""
+    table = raw[data_rows(raw)].reset_index(drop=True)
+    table.columns = ['Komponen'] + list(columns)
+    table['Komponen'] = table['Komponen'].astype(str).str.strip()
+    return table
+
+
+def validate_wide(raw, columns, required=(), identity=False):
+    """Validasi sheet BPS lebar (Komponen x Triwulan I..IV, Tahunan)"""
+    source = _new_source()
+
+    # Schema
+    if raw.shape[1] != 1 + len(columns):
+        _record(source, 'schema', [f'jumlah kolom {raw.shape[1]}, seharusnya {1 + len(columns)}'])
+        return source
+
+    table = wide_table(raw, columns)
+    problems = []
+    if table.empty:
+        problems.append('tidak ada baris data')
+    missing = sorted(set(required) - set(table['Komponen']))
+    if missing:
+        problems.append(f'komponen tidak ditemukan: {_sample(missing)}')
+    _record(source, 'schema', problems)
+
+    # Baris data diharapkan mulai setelah 3 baris judul (asumsi load_data lama)
+    first_row = int(data_rows(raw).argmax())
+    _record(source, 'header_offset',
+            [] if first_row == 3 else [f'baris data mulai di baris {first_row}, bukan 3'],
+            level='warnings')
+
+    # Numeric coercion: sel terisi yang bukan angka
+    values = table[columns]
+    numeric = values.apply(pd.to_numeric, errors='coerce')
+    rows, cols = np.where((values.notna() & numeric.isna()).to_numpy())
+    _record(source, 'numeric', [f'{len(rows)} sel bukan angka: ' +
+                                _sample(f'{table["Komponen"].iat[i]}/{columns[j]}'
+                                        for i, j in zip(rows, cols))]
+            if len(rows) else [])
+
+    # Duplikat komponen
+    dup = table.loc[table['Komponen'].duplicated(), 'Komponen']
+    _record(source, 'duplicates', [f'komponen duplikat: {_sample(dup.unique())}'] if len(dup) else [])
+
+    # Kelengkapan triwulan: harus berurutan dari Triwulan I tanpa lubang,
+    # dan semua komponen punya jumlah triwulan yang sama
+    quarters = [c for c in columns if c in QUARTERS]
+    present = numeric[quarters].notna()
+    gaps = table.loc[(present.cummin(axis=1) != present).any(axis=1), 'Komponen']
+    counts = present.sum(axis=1)
+    short = table.loc[counts < counts.max(), 'Komponen']
+    problems = []
+    if len(gaps):
+        problems.append(f'triwulan bolong: {_sample(gaps)}')
+    if len(short):
+        problems.append(f'triwulan kurang dari {counts.max()}: {_sample(short)}')
+    _record(source, 'completeness', problems)
+
+    # Identitas: komponen pengeluaran dijumlahkan = PDRB per triwulan
+    if identity:
+        by_komponen = numeric[quarters].set_axis(table['Komponen'])
+        by_komponen = by_komponen[~by_komponen.index.duplicated()]
+        if 'PDRB' not in by_komponen.index or not set(IDENTITY_SIGNS) <= set(by_komponen.index):
+            _record(source, 'identity', ['komponen identitas PDRB tidak lengkap, dilewati'],
+                    level='warnings')
+        else:
+            signs = pd.Series(IDENTITY_SIGNS)
+            total = by_komponen.loc[signs.index].mul(signs, axis=0).sum(min_count=1)
+            pdrb = by_komponen.loc['PDRB']
+            rel = ((total - pdrb).abs() / pdrb.abs()).dropna()
+            off = rel[rel > IDENTITY_TOLERANCE]
+            _record(source, 'identity',
+                    [f'jumlah komponen != PDRB pada {q} (selisih {r:.2%})' for q, r in off.items()])
+
+    return source
+
+
+def validate_long(raw, value_name, required=()):
+    """Validasi file ringkas 3 kolom (Komponen, Triwulan Q1..Q4, nilai)"""
+    source = _new_source()
+
+    if raw.shape[1] != 3:
+        _record(source, 'schema', [f'jumlah kolom {raw.shape[1]}, seharusnya 3'])
+        return source
+
+    df = raw.set_axis(['Komponen', 'Triwulan', value_name], axis=1)
+    triwulan = df['Triwulan'].astype(str).str.strip()
+    problems = []
+    unknown = triwulan[~triwulan.isin(QUARTER_CODES)].unique()
+    if len(unknown):
+        problems.append(f'label triwulan tidak dikenal: {_sample(unknown)}')
+    missing = sorted(set(required) - set(df['Komponen'].astype(str).str.strip()))
+    if missing:
+        problems.append(f'komponen tidak ditemukan: {_sample(missing)}')
+    _record(source, 'schema', problems)
+
+    numeric = pd.to_numeric(df[value_name], errors='coerce')
+    bad = df[value_name].notna() & numeric.isna()
+    _record(source, 'numeric', [f'{bad.sum()} nilai bukan angka: ' +
+                                _sample(df.loc[bad, 'Komponen'].astype(str) + '/' + triwulan[bad])]
+            if bad.any() else [])
+
+    keys = df['Komponen'].astype(str) + '/' + triwulan
+    dup = keys[keys.duplicated()]
+    _record(source, 'duplicates', [f'baris duplikat: {_sample(dup.unique())}'] if len(dup) else [])
+
+    present = (pd.crosstab(df['Komponen'], triwulan)
+                 .reindex(columns=QUARTER_CODES, fill_value=0) > 0)
+    gaps = present.index[(present.cummin(axis=1) != present).any(axis=1)]
+    counts = present.sum(axis=1)
+    short = counts.index[counts < counts.max()]
+    problems = []
+    if len(gaps):
+        problems.append(f'triwulan bolong: {_sample(gaps)}')
+    if len(short):
+        problems.append(f'triwulan kurang dari {counts.max()}: {_sample(short)}')
+    _record(source, 'completeness', problems)
+
+    return source
+
+
+def validation_report(checks, version=None):
+    """Jalankan pemeriksaan per sumber ({nama: callable}) dan gabungkan hasilnya.
+
+    Cache dicek sebelum pemeriksaan apa pun dijalankan, jadi versi data yang
+    sama hanya divalidasi sekali.
+    """
+    key = (version, tuple(checks))
+    if version is not None and key in _REPORTS:
+        return _REPORTS[key]
+
+    sources = {name: check() for name, check in checks.items()}
+    report = {
+        'version': version,
+        'valid': all(not src['errors'] for src in sources.values()),
+        'sources': sources,
+    }
+    if version is not None:
+        _REPORTS[key] = report
+    return report
+
+
+def require_valid(report):
+    """Tolak rilis yang gagal validasi sebelum sampai ke kode render"""
+    if not report['valid']:
+        raise DataValidationError(report)
+    return report
+
+
+if __name__ == "__main__":
+    from data_loader import DATA_DIR, data_version, read_raw_data, validate_raw_data
+
+    parser = argparse.ArgumentParser(description="Validasi rilis data PDRB BPS")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="Folder file Excel BPS")
+    parser.add_argument('--output', default=None, help="Simpan report sebagai JSON")
+    args = parser.parse_args()
+
+    version = data_version(args.data_dir)
+    report = validate_raw_data(read_raw_data(args.data_dir), version)
+    for name, src in report['sources'].items():
+        status = '✅' if not src['errors'] else '❌'
+        print(f"{status} {name}: {src['checks']}")
+        for e in src['errors']:
+            print(f"    ❌ {e}")
+        for w in src['warnings']:
+            print(f"    ⚠️ {w}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📄 Report tersimpan: {args.output}")